@@ -3,12 +3,17 @@
 import os
 import json
 import boto3
-import ccxt
+import requests
 import time
 import uuid
-import pandas as pd
 from decimal import Decimal
 
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # Check if running locally (either set in env or detected when running as script)
 IS_LOCAL = os.environ.get('IS_LOCAL', 'false').lower() == 'true'
 
@@ -40,6 +45,16 @@ else:
     dynamodb = boto3.resource("dynamodb")
     table = dynamodb.Table(os.environ["DYNAMO_TABLE"])
 
+# Kept at module scope so warm Lambda containers reuse them across invocations.
+# Secrets are cached for the container lifetime, so a rotated secret is picked
+# up by the next cold start.
+_SECRETS_CACHE = {}
+
+# Market data is read straight from Binance's REST API (the spot testnet by
+# default) over a keep-alive session
+BINANCE_API_URL = os.environ.get("BINANCE_API_URL", "https://testnet.binance.vision")
+_HTTP = requests.Session()
+
 def get_credentials():
     """Get API credentials from environment or Secrets Manager"""
     if IS_LOCAL:
@@ -60,14 +75,34 @@ def get_credentials():
     return api_key, api_secret
 
 def get_secret(secret_name):
-    """Retrieve a secret from AWS Secrets Manager"""
+    """Retrieve a secret from AWS Secrets Manager, cached per container"""
+    if secret_name in _SECRETS_CACHE:
+        return _SECRETS_CACHE[secret_name]
     try:
         response = secrets_client.get_secret_value(SecretId=secret_name)
-        return response["SecretString"]
+        _SECRETS_CACHE[secret_name] = response["SecretString"]
+        return _SECRETS_CACHE[secret_name]
     except Exception as e:
         print(f"Error retrieving secret {secret_name}: {str(e)}")
         return None
 
+def fetch_closes(symbol, interval, limit):
+    """Fetch the close prices of the latest klines from Binance's REST API, as Binance's exact decimal strings"""
+    response = _HTTP.get(
+        f"{BINANCE_API_URL}/api/v3/klines",
+        params={"symbol": symbol.replace("/", ""), "interval": interval, "limit": limit},
+        timeout=5
+    )
+    response.raise_for_status()
+    # Kline rows are [open_time, open, high, low, close, ...] with prices as strings
+    return [row[4] for row in json_loads(response.content)]
+
+def save_trades(items):
+    """Write trade records to DynamoDB, batched into BatchWriteItem calls of up to 25 items"""
+    with table.batch_writer(overwrite_by_pkeys=["trade_id"]) as batch:
+        for item in items:
+            batch.put_item(Item=item)
+
 def run_trading_bot():
     """Main trading bot logic"""
     try:
@@ -79,44 +114,28 @@ def run_trading_bot():
             print(error_msg)
             return {"statusCode": 400, "body": json.dumps({"error": error_msg})}
         
-        # Initialize exchange
-        exchange = ccxt.binance({
-            "apiKey": api_key,
-            "secret": api_secret,
-            "enableRateLimit": True,
-            "options": {
-                "defaultType": "spot"
-            }
-        })
-        exchange.set_sandbox_mode(True)
-        
-        if IS_LOCAL:
-            print("Connected to Binance sandbox mode")
-        
         # Define trading parameters
         symbol = "BTC/USDT"
         timeframe = "1h"
+        sma_period = 20
         
-        # Fetch OHLCV data
+        # Fetch close prices
         if IS_LOCAL:
             print(f"Fetching {timeframe} data for {symbol}...")
         
-        ohlcv = exchange.fetch_ohlcv(symbol, timeframe, limit=50)
+        # Only the bars inside the SMA window are needed
+        closes = fetch_closes(symbol, timeframe, limit=sma_period)
         
-        if not ohlcv or len(ohlcv) < 20:
+        if len(closes) < sma_period:
             error_msg = "Error: Not enough data points for SMA calculation"
             print(error_msg)
             return {"statusCode": 400, "body": json.dumps({"error": error_msg})}
         
-        # Create dataframe and calculate SMA20
-        df = pd.DataFrame(ohlcv, columns=["timestamp", "open", "high", "low", "close", "volume"])
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-        df["sma20"] = df["close"].rolling(window=20).mean()
-        
-        # Get last data point for analysis
-        last = df.iloc[-1]
-        price = last["close"]
-        sma = last["sma20"]
+        # Calculate SMA20 directly on the close prices; floats are only used
+        # for the comparison, the recorded price keeps Binance's exact string
+        raw_price = closes[-1]
+        price = float(raw_price)
+        sma = sum(map(float, closes)) / sma_period
         
         if IS_LOCAL:
             print(f"Current price: {price}")
@@ -138,14 +157,14 @@ def run_trading_bot():
                 "trade_id": str(uuid.uuid4()),
                 "symbol": symbol,
                 "signal": signal,
-                "price": Decimal(str(price)),
+                "price": Decimal(raw_price),
                 "timestamp": int(time.time())
             }
             
             # Save to DynamoDB if available
             if table:
                 try:
-                    table.put_item(Item=trade)
+                    save_trades([trade])
                     if IS_LOCAL:
                         print(f"Trade recorded in DynamoDB table: {table_name}")
                 except Exception as e:
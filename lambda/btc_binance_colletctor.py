@@ -11,6 +11,7 @@ from decimal import Decimal
 
 import psycopg2
 import requests
+from psycopg2.extras import execute_batch
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -19,8 +20,41 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 class FullBinanceCollector:
+    # The UPSERT is prepared once per connection so Postgres parses and plans
+    # the ON CONFLICT statement once instead of on every insert
+    PREPARE_QUERY = """
+    PREPARE ins_ohlcv (
+        varchar, varchar, bigint, numeric, numeric,
+        numeric, numeric, numeric, bigint, numeric,
+        integer, numeric, numeric
+    ) AS
+    INSERT INTO ohlcv_data (
+        symbol, timeframe, open_time, open_price, high_price, 
+        low_price, close_price, volume, close_time, quote_volume,
+        trades_count, taker_buy_base_volume, taker_buy_quote_volume
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+    ON CONFLICT (symbol, timeframe, open_time) 
+    DO UPDATE SET
+        open_price = EXCLUDED.open_price,
+        high_price = EXCLUDED.high_price,
+        low_price = EXCLUDED.low_price,
+        close_price = EXCLUDED.close_price,
+        volume = EXCLUDED.volume,
+        close_time = EXCLUDED.close_time,
+        quote_volume = EXCLUDED.quote_volume,
+        trades_count = EXCLUDED.trades_count,
+        taker_buy_base_volume = EXCLUDED.taker_buy_base_volume,
+        taker_buy_quote_volume = EXCLUDED.taker_buy_quote_volume,
+        updated_at = NOW()
+    """
+    EXECUTE_QUERY = "EXECUTE ins_ohlcv (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"
+    
     def __init__(self):
         # Use testnet for sandbox mode
+        # Latency note: api.binance.com is served from AWS ap-northeast-1 (Tokyo).
+        # Running the collector in that region keeps each kline request to a few ms
+        # instead of a 100-250ms cross-region round trip. For the testnet, resolve
+        # the host and pick the matching region (see terraform/variables.tf).
         self.base_url = "https://testnet.binance.vision" if os.getenv('BINANCE_SANDBOX', 'true').lower() == 'true' else "https://api.binance.com"
         
         self.db_config = {
@@ -32,15 +66,34 @@ class FullBinanceCollector:
         }
         
         self.symbol = os.getenv('SYMBOL', 'BTCUSDT')
+        self._conn = None
+        
+        # Keep-alive HTTP session so repeated kline requests reuse the TLS connection
+        self._http = requests.Session()
+        self._http.headers.update({'User-Agent': 'binance-collector/1.0'})
         logger.info(f"Initialized collector for {self.symbol} using {self.base_url}")
     
     def get_db_connection(self):
-        return psycopg2.connect(**self.db_config)
+        """Return the cached database connection, reconnecting if it is closed"""
+        if self._conn is None or self._conn.closed:
+            conn = psycopg2.connect(**self.db_config)
+            # Prepared statements live for the session, so prepare on every new connection
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(self.PREPARE_QUERY)
+                conn.commit()
+            except Exception:
+                # Not cached yet, so close it here rather than leak it on every retry
+                conn.close()
+                raise
+            self._conn = conn
+        return self._conn
     
     def fetch_full_klines(self, symbol, interval='1m', limit=2):
         """
         Fetch complete klines data directly from Binance API
         Returns all 12 fields including quote_volume, trades_count, etc.
+        for every closed kline (the still-open last kline is dropped)
         """
         try:
             url = f"{self.base_url}/api/v3/klines"
@@ -50,7 +103,7 @@ class FullBinanceCollector:
                 'limit': limit
             }
             
-            response = requests.get(url, params=params, timeout=30)
+            response = self._http.get(url, params=params, timeout=30)
             response.raise_for_status()
             
             klines = response.json()
@@ -59,8 +112,8 @@ class FullBinanceCollector:
                 logger.warning(f"Insufficient data received for {symbol}")
                 return None
             
-            # Return the second-to-last kline (last complete one)
-            return klines[-2]
+            # Drop the last kline, which is still in progress
+            return klines[:-1]
             
         except requests.exceptions.RequestException as e:
             logger.error(f"API request error for {symbol}: {e}")
@@ -77,21 +130,23 @@ class FullBinanceCollector:
             # Full Binance kline format:
             # [open_time, open, high, low, close, volume, close_time, quote_volume, 
             #  trades_count, taker_buy_base_volume, taker_buy_quote_volume, unused]
+            # Price and volume fields arrive as JSON strings, so they are parsed
+            # into Decimal directly without a str() round trip
             
             record = (
                 symbol,                          # symbol
                 timeframe,                       # timeframe
                 int(kline[0]),                  # open_time
-                Decimal(str(kline[1])),         # open_price
-                Decimal(str(kline[2])),         # high_price
-                Decimal(str(kline[3])),         # low_price
-                Decimal(str(kline[4])),         # close_price
-                Decimal(str(kline[5])),         # volume (base asset)
+                Decimal(kline[1]),              # open_price
+                Decimal(kline[2]),              # high_price
+                Decimal(kline[3]),              # low_price
+                Decimal(kline[4]),              # close_price
+                Decimal(kline[5]),              # volume (base asset)
                 int(kline[6]),                  # close_time
-                Decimal(str(kline[7])),         # quote_volume (USDT volume)
+                Decimal(kline[7]),              # quote_volume (USDT volume)
                 int(kline[8]),                  # trades_count
-                Decimal(str(kline[9])),         # taker_buy_base_volume
-                Decimal(str(kline[10])),        # taker_buy_quote_volume
+                Decimal(kline[9]),              # taker_buy_base_volume
+                Decimal(kline[10]),             # taker_buy_quote_volume
             )
             
             return record
@@ -102,59 +157,72 @@ class FullBinanceCollector:
     
     def store_kline_data(self, record):
         """Store single kline record in database"""
-        insert_query = """
-        INSERT INTO ohlcv_data (
-            symbol, timeframe, open_time, open_price, high_price, 
-            low_price, close_price, volume, close_time, quote_volume,
-            trades_count, taker_buy_base_volume, taker_buy_quote_volume
-        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (symbol, timeframe, open_time) 
-        DO UPDATE SET
-            open_price = EXCLUDED.open_price,
-            high_price = EXCLUDED.high_price,
-            low_price = EXCLUDED.low_price,
-            close_price = EXCLUDED.close_price,
-            volume = EXCLUDED.volume,
-            close_time = EXCLUDED.close_time,
-            quote_volume = EXCLUDED.quote_volume,
-            trades_count = EXCLUDED.trades_count,
-            taker_buy_base_volume = EXCLUDED.taker_buy_base_volume,
-            taker_buy_quote_volume = EXCLUDED.taker_buy_quote_volume,
-            updated_at = NOW()
-        """
-        
+        return self.store_kline_data_batch([record])
+    
+    def store_kline_data_batch(self, records):
+        """Upsert a batch of kline records through the prepared statement and commit"""
+        if not records:
+            logger.info("No closed klines to store")
+            return True
+
         try:
-            with self.get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute(insert_query, record)
-                    conn.commit()
-                    
-                    # Log the stored data with full details
-                    timestamp = datetime.fromtimestamp(record[2] / 1000)  # open_time
-                    logger.info(f"Stored: {timestamp} - Close: ${record[6]}, Volume: {record[7]} BTC, "
-                              f"Quote Volume: ${record[9]:,.2f} USDT, Trades: {record[10]}")
-                    return True
+            conn = self.get_db_connection()
+            with conn.cursor() as cur:
+                # execute_batch sends up to 500 EXECUTEs per round trip
+                execute_batch(cur, self.EXECUTE_QUERY, records, page_size=500)
+            conn.commit()
+            
+            # Log the most recent stored kline with full details
+            record = records[-1]
+            timestamp = datetime.fromtimestamp(record[2] / 1000)  # open_time
+            logger.info(f"Stored {len(records)} kline(s), latest: {timestamp} - Close: ${record[6]}, "
+                      f"Volume: {record[7]} BTC, Quote Volume: ${record[9]:,.2f} USDT, Trades: {record[10]}")
+            return True
                     
+        except psycopg2.OperationalError as e:
+            # Connection is unusable; drop it so the next call reconnects
+            logger.error(f"Database connection error: {e}")
+            self._reset_connection()
+            return False
         except psycopg2.Error as e:
             logger.error(f"Database error: {e}")
+            self._rollback()
             return False
         except Exception as e:
             logger.error(f"Unexpected error storing data: {e}")
+            self._rollback()
             return False
     
+    def _rollback(self):
+        """Roll back the failed transaction so the cached connection stays usable"""
+        if self._conn is not None and not self._conn.closed:
+            try:
+                self._conn.rollback()
+            except psycopg2.Error:
+                self._reset_connection()
+    
+    def _reset_connection(self):
+        """Close and forget the cached connection"""
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except psycopg2.Error:
+                pass
+        self._conn = None
+    
     def collect_btc_data(self):
         """Collect complete BTC/USDT data with all fields"""
         logger.info("Fetching complete BTC/USDT kline data...")
         
         # Fetch full klines data
-        kline = self.fetch_full_klines(self.symbol, '1m', 2)
+        klines = self.fetch_full_klines(self.symbol, '1m', 2)
         
-        if kline:
-            # Convert to database record
-            record = self.convert_kline_to_record(kline, self.symbol, '1m')
+        if klines:
+            # Convert to database records
+            records = [self.convert_kline_to_record(kline, self.symbol, '1m') for kline in klines]
             
-            if record:
-                success = self.store_kline_data(record)
+            if all(records):
+                success = self.store_kline_data_batch(records)
                 if success:
                     logger.info("BTC data collection completed successfully")
                     return True
@@ -4,21 +4,24 @@ from dotenv import load_dotenv, dotenv_values
 
 conn = None
 
+# read the .env file once at import instead of on every connect.
+load_dotenv()
+_DB_CONFIG = {
+    "host": os.getenv("DB_HOST"),
+    "dbname": os.getenv("DB_NAME"),
+    "user": os.getenv("DB_USER"),
+    "password": os.getenv("DB_PASSWORD"),
+    "port": os.getenv("DB_PORT")
+}
+
 # function to establish connection with postgres DB.
 def get_postgres_connection():
 
     conn = None
-    load_dotenv()
 
     print('Connecting to the PostgreSQL database...')
     try:
-        conn = psycopg2.connect (
-            host = os.getenv("DB_HOST"),
-            dbname = os.getenv("DB_NAME"),
-            user = os.getenv("DB_USER"),
-            password = os.getenv("DB_PASSWORD"),
-            port = os.getenv("DB_PORT")
-        )
+        conn = psycopg2.connect(**_DB_CONFIG)
         
         if conn is None:
             print('Connection to the DB failed.')
@@ -9,13 +9,15 @@ def meanReversion():
         return
 
     try:
-        cur = conn.cursor()
+        # named (server-side) cursor: rows are streamed 1000 at a time
+        # instead of loading the whole table into memory with fetchall().
+        cur = conn.cursor(name="report_card_stream")
+        cur.itersize = 1000
         cur.execute("SELECT * FROM report_card;")
-        response = cur.fetchall()
         
         print(f"ID | created_at | algorithm_version | start_date | end_date | performance")
     
-        for row in response:
+        for row in cur:
             id, created_at, algorithm_version, start_date, end_date, performance = row
             print(f"{id} | {created_at} | {algorithm_version} | {start_date} | {end_date} | {performance}")
         
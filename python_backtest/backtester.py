@@ -2,7 +2,249 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, List
 from strategies.base import Strategy
+from utils.jit import njit, prange
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import copy
+import functools
 import logging
+import multiprocessing
+import os
+import sys
+
+# Annualisation factor for per-minute returns (252 trading days x 24h x 60min)
+ANNUALIZATION = np.sqrt(252 * 24 * 60)
+
+# One record per closed trade, written by the simulation kernel
+TRADE_DTYPE = np.dtype([
+    ('entry_bar', np.int64),
+    ('exit_bar', np.int64),
+    ('entry_price', np.float64),
+    ('exit_price', np.float64),
+    ('shares', np.float64),  # negative for shorts
+])
+
+
+def _simulate_impl(close, signals, new_day, initial_capital, position_size, stop_loss, reinvest_profits):
+    """
+    Bar-by-bar portfolio simulation kernel.
+    
+    Args:
+        close (np.ndarray): Close prices (float64)
+        signals (np.ndarray): Strategy signals (1 buy, -1 sell, 0 none); stop-loss
+            exits are written back into this array in place
+        new_day (np.ndarray): True where a bar starts a new calendar day
+        initial_capital (float): Starting portfolio value
+        position_size (float): Fraction of available cash used per trade
+        stop_loss (float): Loss fraction that forces an exit
+        reinvest_profits (bool): Add the previous day's profit to cash on a new day
+        
+    Returns:
+        tuple: (position, cash, holdings, total_value, daily_pnl, stop_entry, trades)
+            arrays. stop_entry holds the entry price of a position closed by the
+            stop-loss on that bar and 0 elsewhere. trades is a TRADE_DTYPE
+            structured array with one record per closed trade; shares are
+            negative for shorts.
+            
+    Only NumPy arrays and scalars are used so the loop compiles with Numba;
+    logging of stop-loss events is left to the caller.
+    """
+    total_rows = close.shape[0]
+    position_arr = np.zeros(total_rows, dtype=np.float64)
+    cash = np.empty(total_rows, dtype=np.float64)
+    stop_entry = np.zeros(total_rows, dtype=np.float64)
+    # A trade opens and closes on different bars, so there are at most n/2
+    trades = np.empty(total_rows // 2 + 1, dtype=TRADE_DTYPE)
+    num_trades = 0
+    
+    position = 0  # 0: no position, 1: long, -1: short
+    entry_price = 0.0
+    entry_bar = 0
+    daily_start_value = initial_capital
+    
+    for i in range(total_rows):
+        current_price = close[i]
+        signal = signals[i]
+        
+        # Carry cash and position forward; trades below overwrite them
+        if i > 0:
+            cash[i] = cash[i-1]
+            position_arr[i] = position_arr[i-1]
+            
+            # Check if it's a new day for profit reinvestment
+            if new_day[i]:
+                # Previous bar's portfolio value; the full series is computed after the loop
+                prev_total = cash[i-1] + position_arr[i-1] * close[i-1]
+                # New day - reinvest profits if enabled
+                if reinvest_profits and prev_total > daily_start_value:
+                    cash[i] += prev_total - daily_start_value
+                daily_start_value = prev_total
+        else:
+            cash[i] = initial_capital
+        
+        # Check stop loss if in position
+        if position != 0:
+            if position == 1:  # Long position
+                loss_pct = (entry_price - current_price) / entry_price
+                if loss_pct >= stop_loss:
+                    # Stop loss triggered
+                    stop_entry[i] = entry_price
+                    signals[i] = -1
+                    signal = -1
+            else:  # Short position
+                loss_pct = (current_price - entry_price) / entry_price
+                if loss_pct >= stop_loss:
+                    # Stop loss triggered
+                    stop_entry[i] = entry_price
+                    signals[i] = 1
+                    signal = 1
+        
+        # Execute trades
+        if signal == 1 and position == 0:  # Buy signal
+            position = 1
+            entry_price = current_price
+            entry_bar = i
+            trade_value = cash[i] * position_size
+            shares = trade_value / current_price
+            position_arr[i] = shares
+            cash[i] = cash[i] - trade_value
+            
+        elif signal == -1 and position == 0:  # Sell signal (short)
+            position = -1
+            entry_price = current_price
+            entry_bar = i
+            trade_value = cash[i] * position_size
+            shares = trade_value / current_price
+            position_arr[i] = -shares
+            cash[i] = cash[i] - trade_value
+            
+        elif signal == -1 and position == 1:  # Close long position
+            shares = position_arr[i]
+            trade_value = shares * current_price
+            position_arr[i] = 0
+            cash[i] = cash[i] + trade_value
+            position = 0
+            
+            trades[num_trades]['entry_bar'] = entry_bar
+            trades[num_trades]['exit_bar'] = i
+            trades[num_trades]['entry_price'] = entry_price
+            trades[num_trades]['exit_price'] = current_price
+            trades[num_trades]['shares'] = shares
+            num_trades += 1
+            
+        elif signal == 1 and position == -1:  # Close short position
+            shares = abs(position_arr[i])
+            trade_value = shares * current_price
+            position_arr[i] = 0
+            cash[i] = cash[i] + trade_value
+            position = 0
+            
+            trades[num_trades]['entry_bar'] = entry_bar
+            trades[num_trades]['exit_bar'] = i
+            trades[num_trades]['entry_price'] = entry_price
+            trades[num_trades]['exit_price'] = current_price
+            trades[num_trades]['shares'] = -shares
+            num_trades += 1
+    
+    # Holdings, portfolio value and P&L only depend on the finished position
+    # and cash arrays, so they are computed as whole-array operations
+    holdings = position_arr * close
+    total_value = cash + holdings
+    daily_pnl = np.zeros(total_rows, dtype=np.float64)
+    daily_pnl[1:] = total_value[1:] - total_value[:-1]
+    
+    return position_arr, cash, holdings, total_value, daily_pnl, stop_entry, trades[:num_trades]
+
+
+@functools.cache
+def _make_simulator(nogil: bool = True, fastmath: bool = False):
+    """
+    Compile _simulate_impl with the given Numba options, once per combination.
+    
+    Args:
+        nogil (bool): Release the GIL while the kernel runs
+        fastmath (bool): Allow Numba's fast-math floating point optimisations
+        
+    Returns:
+        The compiled kernel; every Backtester with the same engine_kwargs
+        shares it instead of triggering a new compilation.
+    """
+    # Numba's on-disk cache is not keyed on these flags, so only the default
+    # build is written to disk
+    cache = nogil and not fastmath
+    return njit(cache=cache, nogil=nogil, fastmath=fastmath)(_simulate_impl)
+
+
+_simulate = _make_simulator()
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def _simulate_many(close, signal_matrix, new_day, initial_capital, position_size, stop_loss, reinvest_profits):
+    """
+    Run the default _simulate kernel once per row of a signal matrix, in parallel.
+    
+    Args:
+        close (np.ndarray): Close prices (float64), shared by all runs
+        signal_matrix (np.ndarray): 2D int8 array, one row of signals per run;
+            stop-loss exits are written back into it in place
+        new_day, initial_capital, position_size, stop_loss, reinvest_profits:
+            As for _simulate
+            
+    Returns:
+        np.ndarray: 2D array of total portfolio value, one row per run
+        
+    Runs are independent, so Numba's prange spreads them over all cores.
+    """
+    num_runs = signal_matrix.shape[0]
+    total_value = np.empty((num_runs, close.shape[0]), dtype=np.float64)
+    for k in prange(num_runs):
+        result = _simulate(close, signal_matrix[k], new_day, initial_capital,
+                           position_size, stop_loss, reinvest_profits)
+        total_value[k, :] = result[3]
+    return total_value
+
+
+def _new_day_mask(index: pd.DatetimeIndex) -> np.ndarray:
+    """Flag the first bar of each calendar day (used for profit reinvestment)."""
+    # Compare day numbers as int64 instead of building datetime.date objects.
+    # Naive timestamps can be truncated to days by a plain datetime64 cast
+    # (whatever their unit); tz-aware ones need normalize() for local midnight
+    if index.tz is None:
+        day_id = index.to_numpy().astype('datetime64[D]').view(np.int64)
+    else:
+        day_id = index.normalize().asi8
+    new_day = np.zeros(len(index), dtype=np.bool_)
+    new_day[1:] = day_id[1:] != day_id[:-1]
+    return new_day
+
+
+# Price data shared with worker processes; set once per worker by _init_worker
+_WORKER_DATA = None
+
+
+def _init_worker(data: pd.DataFrame):
+    """Process pool initializer: keep the price data for every task in this worker."""
+    global _WORKER_DATA
+    _WORKER_DATA = data
+
+
+def _run_one(backtester: "Backtester", strategy: Strategy, data: pd.DataFrame = None):
+    """
+    Run one strategy, in a worker process or in-process (module level so it can be pickled).
+    
+    Args:
+        backtester (Backtester): Configured backtester to run with
+        strategy (Strategy): Strategy to evaluate
+        data (pd.DataFrame): Price data; defaults to the worker's shared copy
+        
+    Returns:
+        tuple: (number of raw strategy signals, backtest results)
+    """
+    if data is None:
+        data = _WORKER_DATA
+    signals = strategy.generate_signals_np(data)
+    signal_count = int(np.count_nonzero(signals))
+    return signal_count, backtester.run(data, strategy, signals=signals)
+
 
 class Backtester:
     """
@@ -29,21 +271,32 @@ class Backtester:
             - Higher values = more room for recovery, fewer stop-outs
             - Range: 0.01-0.05 (1%-5% loss tolerance)
             - 0.02 = 2% stop loss
+            
+        engine_kwargs (dict): Numba options for the simulation kernel (default: None)
+            - nogil (default True) and fastmath (default False)
+            - Backtesters with the same options share one compiled kernel
+            - fastmath trades exact IEEE semantics for speed; results may
+              differ in the last bits
     """
     
-    def __init__(self, initial_capital: float = 100.0, position_size: float = 0.8, stop_loss: float = 0.02):
+    def __init__(self, initial_capital: float = 100.0, position_size: float = 0.8, stop_loss: float = 0.02,
+                 engine_kwargs: Dict[str, bool] = None):
         self.initial_capital = initial_capital
         self.position_size = position_size  # Use 80% of available capital per trade
         self.stop_loss = stop_loss
         self.reinvest_profits = True  # Reinvest profits daily
+        self.engine_kwargs = dict(engine_kwargs or {})  # Numba options for the simulation kernel
+        self._trades = []  # Closed trades from the most recent run()
         
-    def run(self, data: pd.DataFrame, strategy: Strategy) -> Dict[str, Any]:
+    def run(self, data: pd.DataFrame, strategy: Strategy, signals=None) -> Dict[str, Any]:
         """
         Execute backtest simulation with the given strategy and data.
         
         Args:
             data (pd.DataFrame): Price data with datetime index and 'Close' column
             strategy (Strategy): Trading strategy object implementing generate_signals()
+            signals (pd.Series or np.ndarray): Signals already generated by strategy
+                for data (optional; generated here when omitted)
             
         Returns:
             Dict[str, Any]: Backtest results containing:
@@ -56,6 +309,8 @@ class Backtester:
                 - num_trades: Total number of trades executed
                 - win_rate: Percentage of profitable trades
                 - profit_factor: Ratio of gross profit to gross loss
+                - trades: List of closed trades (see get_trade_log())
+                - trade_events: The same trades as a TRADE_DTYPE structured array
                 
         Simulation Logic:
             1. Generate trading signals from strategy
@@ -65,157 +320,221 @@ class Backtester:
             5. Reinvest profits daily
             6. Calculate performance metrics
         """
-        signals = strategy.generate_signals(data)
-        
-        # Initialize portfolio tracking
-        portfolio = pd.DataFrame(index=data.index)
-        portfolio['price'] = data['Close']
-        portfolio['signal'] = signals
-        portfolio['position'] = 0.0
-        portfolio['cash'] = self.initial_capital
-        portfolio['holdings'] = 0.0
-        portfolio['total_value'] = self.initial_capital
-        portfolio['daily_pnl'] = 0.0
+        if signals is None:
+            signals = strategy.generate_signals_np(data)
+        
+        # Pull the inputs out of pandas once; the simulation kernel only
+        # works on plain NumPy arrays
+        close = data['Close'].to_numpy(dtype=np.float64)
+        signal_arr = np.array(signals, dtype=np.int8)  # copied: stop-loss exits are written back into this
+        
+        # Flag the first bar of each calendar day for profit reinvestment
+        new_day = _new_day_mask(data.index)
         
         # Log initial portfolio state
         logging.info(f"Initial capital: ${self.initial_capital:.2f}")
         logging.info(f"Position size: {self.position_size:.1%}")
         logging.info(f"Stop loss: {self.stop_loss:.1%}")
         
-        position = 0  # 0: no position, 1: long, -1: short
-        entry_price = 0
-        entry_time = None
-        daily_start_value = self.initial_capital
-        
         total_rows = len(data)
         print(f"Processing {total_rows:,} rows...")
         
-        for i in range(total_rows):
-            if i % 10000 == 0:  # Progress indicator every 10k rows
-                print(f"Progress: {i:,}/{total_rows:,} ({i/total_rows*100:.1f}%)")
-                
-            current_price = data['Close'].iloc[i]
-            current_time = data.index[i]
-            signal = signals.iloc[i]
-            
-            # Check if it's a new day for profit reinvestment
-            if i > 0:
-                prev_time = data.index[i-1]
-                if current_time.date() != prev_time.date():
-                    # New day - reinvest profits if enabled
-                    if self.reinvest_profits and portfolio['total_value'].iloc[i-1] > daily_start_value:
-                        profit = portfolio['total_value'].iloc[i-1] - daily_start_value
-                        portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i-1] + profit
-                        daily_start_value = portfolio['total_value'].iloc[i-1]
-                    else:
-                        portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i-1]
-                        daily_start_value = portfolio['total_value'].iloc[i-1]
-            else:
-                portfolio.loc[current_time, 'cash'] = self.initial_capital
-            
-            # Check stop loss if in position
-            if position != 0:
-                if position == 1:  # Long position
+        simulate = _make_simulator(**self.engine_kwargs)
+        position_arr, cash, holdings, total_value, daily_pnl, stop_entry, trades = simulate(
+            close, signal_arr, new_day, float(self.initial_capital),
+            float(self.position_size), float(self.stop_loss), self.reinvest_profits
+        )
+        
+        # Timestamps below are gathered with one vectorised take per event
+        # type instead of indexing the DatetimeIndex once per event
+        index = data.index
+        
+        # Report stop-loss exits recorded by the kernel; skipped entirely (and
+        # formatted lazily otherwise) when INFO logging is off
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            stop_bars = np.flatnonzero(stop_entry)
+            for i, stop_time in zip(stop_bars, index[stop_bars]):
+                entry_price = stop_entry[i]
+                current_price = close[i]
+                if signal_arr[i] == -1:  # Long position stopped out
                     loss_pct = (entry_price - current_price) / entry_price
-                    if loss_pct >= self.stop_loss:
-                        # Stop loss triggered
-                        logging.info(f"Stop-loss triggered at {current_time}: Entry {entry_price:.2f}, Exit {current_price:.2f}, Loss {loss_pct:.1%}")
-                        portfolio.loc[current_time, 'signal'] = -1
-                        signal = -1
-                else:  # Short position
+                else:  # Short position stopped out
                     loss_pct = (current_price - entry_price) / entry_price
-                    if loss_pct >= self.stop_loss:
-                        # Stop loss triggered
-                        logging.info(f"Stop-loss triggered at {current_time}: Entry {entry_price:.2f}, Exit {current_price:.2f}, Loss {loss_pct:.1%}")
-                        portfolio.loc[current_time, 'signal'] = 1
-                        signal = 1
-            
-            # Execute trades
-            if signal == 1 and position == 0:  # Buy signal
-                position = 1
-                entry_price = current_price
-                entry_time = current_time
-                trade_value = portfolio['cash'].iloc[i] * self.position_size
-                shares = trade_value / current_price
-                portfolio.loc[current_time, 'position'] = shares
-                portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i] - trade_value
-                
-            elif signal == -1 and position == 0:  # Sell signal (short)
-                position = -1
-                entry_price = current_price
-                entry_time = current_time
-                trade_value = portfolio['cash'].iloc[i] * self.position_size
-                shares = trade_value / current_price
-                portfolio.loc[current_time, 'position'] = -shares
-                portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i] - trade_value
-                
-            elif signal == -1 and position == 1:  # Close long position
-                shares = portfolio['position'].iloc[i-1] if i > 0 else portfolio['position'].iloc[i]
-                trade_value = shares * current_price
-                portfolio.loc[current_time, 'position'] = 0
-                portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i] + trade_value
-                position = 0
-                
-            elif signal == 1 and position == -1:  # Close short position
-                shares = abs(portfolio['position'].iloc[i-1] if i > 0 else portfolio['position'].iloc[i])
-                trade_value = shares * current_price
-                portfolio.loc[current_time, 'position'] = 0
-                portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i] + trade_value
-                position = 0
-                
-            else:  # No signal, maintain current position
-                if i > 0:
-                    portfolio.loc[current_time, 'position'] = portfolio['position'].iloc[i-1]
-                    portfolio.loc[current_time, 'cash'] = portfolio['cash'].iloc[i]
-                else:
-                    portfolio.loc[current_time, 'position'] = 0
-                    portfolio.loc[current_time, 'cash'] = self.initial_capital
-            
-            # Calculate current holdings value
-            portfolio.loc[current_time, 'holdings'] = portfolio['position'].iloc[i] * current_price
-            
-            # Calculate total portfolio value
-            portfolio.loc[current_time, 'total_value'] = (
-                portfolio['cash'].iloc[i] + portfolio['holdings'].iloc[i]
+                logging.info("Stop-loss triggered at %s: Entry %.2f, Exit %.2f, Loss %.1f%%",
+                             stop_time, entry_price, current_price, loss_pct * 100)
+        
+        # Keep the trades the kernel closed; direction-adjusted profit per trade
+        profits = (trades['exit_price'] - trades['entry_price']) * trades['shares']
+        self._trades = [
+            {
+                'entry_time': entry_time,
+                'entry_price': entry_price,
+                'exit_time': exit_time,
+                'exit_price': exit_price,
+                'shares': shares,
+                'profit': profit
+            }
+            for entry_time, exit_time, entry_price, exit_price, shares, profit in zip(
+                index[trades['entry_bar']], index[trades['exit_bar']],
+                trades['entry_price'].tolist(), trades['exit_price'].tolist(),
+                trades['shares'].tolist(), profits.tolist()
             )
-            
-            # Calculate daily P&L
-            if i > 0:
-                portfolio.loc[current_time, 'daily_pnl'] = (
-                    portfolio['total_value'].iloc[i] - portfolio['total_value'].iloc[i-1]
-                )
+        ]
+        
+        # Calculate performance metrics on the raw arrays (bar-to-bar returns,
+        # skipping the undefined 0/0 case like pct_change().dropna() did)
+        returns = np.diff(total_value) / total_value[:-1]
+        returns = returns[~np.isnan(returns)]
         
-        # Calculate performance metrics
-        returns = portfolio['total_value'].pct_change().dropna()
+        # P&L of the bars where a trade was executed, shared by the trade metrics
+        trade_mask = signal_arr != 0
+        trade_pnl = daily_pnl[trade_mask]
         
         # Log final portfolio state
-        final_value = portfolio['total_value'].iloc[-1]
+        final_value = total_value[-1]
         total_return = (final_value - self.initial_capital) / self.initial_capital
         logging.info(f"Final portfolio value: ${final_value:.2f}")
         logging.info(f"Total return: {total_return:.2%}")
         logging.info(f"Total profit: ${final_value - self.initial_capital:.2f}")
         
+        # The arrays above are the working data; the portfolio DataFrame is
+        # only built for callers, wrapping them without another copy
+        portfolio = pd.DataFrame({
+            'price': close,
+            'signal': signal_arr,
+            'position': position_arr,
+            'cash': cash,
+            'holdings': holdings,
+            'total_value': total_value,
+            'daily_pnl': daily_pnl
+        }, index=data.index, copy=False)
+        
         results = {
             'portfolio': portfolio,
             'total_return': total_return,
-            'annualized_return': self._calculate_annualized_return(portfolio['total_value']),
+            'annualized_return': self._calculate_annualized_return(total_value, data.index),
             'sharpe_ratio': self._calculate_sharpe_ratio(returns),
-            'max_drawdown': self._calculate_max_drawdown(portfolio['total_value']),
-            'volatility': returns.std() * np.sqrt(252 * 24 * 60),  # Annualized volatility
-            'num_trades': len(portfolio[portfolio['signal'] != 0]),
-            'win_rate': self._calculate_win_rate(portfolio),
-            'profit_factor': self._calculate_profit_factor(portfolio)
+            'max_drawdown': self._calculate_max_drawdown(total_value),
+            'volatility': returns.std(ddof=1) * ANNUALIZATION,  # Annualized volatility
+            'num_trades': len(trade_pnl),
+            'win_rate': self._calculate_win_rate(trade_pnl),
+            'profit_factor': self._calculate_profit_factor(trade_pnl),
+            'trades': self._trades,
+            'trade_events': trades
         }
         
         return results
     
-    def run_multiple_strategies(self, data: pd.DataFrame, strategies: Dict[str, Strategy]) -> Dict[str, Any]:
+    def get_trade_log(self) -> List[Dict[str, Any]]:
+        """
+        Return the trades closed during the most recent run().
+        
+        Returns:
+            List[Dict[str, Any]]: One dict per trade with entry_time, entry_price,
+            exit_time, exit_price, shares (negative for shorts) and profit
+            
+        Trades are recorded by the simulation itself, so no second pass over
+        the signals is needed. Positions still open at the end are not included.
+        """
+        return self._trades
+    
+    def run_batch(self, data: pd.DataFrame, signal_matrix, names: List[str] = None) -> pd.DataFrame:
+        """
+        Simulate many signal series over the same price data in one call.
+        
+        Args:
+            data (pd.DataFrame): Price data with datetime index and 'Close' column
+            signal_matrix: 2D array-like of shape (runs, bars), one row of
+                signals per run (e.g. one per parameter set of a grid search)
+            names (List[str]): Optional column names, one per run
+            
+        Returns:
+            pd.DataFrame: Total portfolio value over time, one column per run
+            
+        Generate the parameter grid's signals once, then call this instead of
+        run() in a loop; the runs execute in parallel when Numba is installed.
+        Only the equity curves are returned, use run() for full metrics.
+        The batch kernel always uses the default engine options.
+        """
+        close = data['Close'].to_numpy(dtype=np.float64)
+        sigs_2d = np.array(signal_matrix, dtype=np.int8)  # copied: stop-loss exits are written into it
+        if sigs_2d.ndim != 2 or sigs_2d.shape[1] != len(data):
+            raise ValueError(f"signal_matrix must have shape (runs, {len(data)}), got {sigs_2d.shape}")
+        
+        total_value = _simulate_many(
+            close, sigs_2d, _new_day_mask(data.index), float(self.initial_capital),
+            float(self.position_size), float(self.stop_loss), self.reinvest_profits
+        )
+        return pd.DataFrame(total_value.T, index=data.index, columns=names)
+    
+    def iter_strategies(self, data: pd.DataFrame, strategies: Dict[str, Strategy],
+                        max_workers: int = None, use_threads: bool = False):
+        """
+        Run several strategies on the same data, yielding each result as soon as it is ready.
+        
+        Args:
+            data (pd.DataFrame): Price data with datetime index and 'Close' column
+            strategies (Dict[str, Strategy]): Dictionary of strategy names and strategy objects
+            max_workers (int): Worker processes to run strategies in (default: one
+                per strategy, capped at the CPU count); 1 runs them in this process
+            use_threads (bool): Use worker threads instead of processes (default: False)
+                - No pickling of data or results; the simulation kernel releases
+                  the GIL, but pandas-heavy signal generation mostly does not
+                - Worth it when results are large relative to signal generation cost
+            
+        Yields:
+            tuple: (strategy name, number of raw strategy signals, backtest results),
+                in completion order
+                
+        Consumers that write out and drop each result as it arrives only ever
+        hold the portfolios that have not been processed yet.
+        """
+        if max_workers is None:
+            max_workers = min(len(strategies), os.cpu_count() or 1)
+        
+        # Strategies share the regime indicators computed for this data until
+        # the last result has been yielded
+        with Strategy.share_indicators(data):
+            if max_workers > 1 and (use_threads or sys.platform.startswith('linux')):
+                # Threads and forked workers see this process's indicator cache, so
+                # compute the indicators shared between strategies once up front
+                # instead of again in every worker
+                for strategy in strategies.values():
+                    strategy.precompute_indicators(data)
+            
+            # Strategies are independent, so each one runs in its own worker
+            if max_workers > 1 and use_threads:
+                # Each thread gets its own copy so run() does not share _trades
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {executor.submit(_run_one, copy.copy(self), strategy, data): name
+                               for name, strategy in strategies.items()}
+                    for future in as_completed(futures):
+                        yield (futures.pop(future),) + future.result()
+            elif max_workers > 1:
+                # The price data goes to each worker process once through the pool
+                # initializer; with fork (Linux) it is inherited copy-on-write
+                # instead of being pickled
+                mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+                with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context,
+                                         initializer=_init_worker, initargs=(data,)) as executor:
+                    futures = {executor.submit(_run_one, self, strategy): name
+                               for name, strategy in strategies.items()}
+                    for future in as_completed(futures):
+                        yield (futures.pop(future),) + future.result()
+            else:
+                for name, strategy in strategies.items():
+                    yield (name,) + _run_one(self, strategy, data)
+    
+    def run_multiple_strategies(self, data: pd.DataFrame, strategies: Dict[str, Strategy],
+                                max_workers: int = None, use_threads: bool = False) -> Dict[str, Any]:
         """
         Run backtest simulation with multiple strategies and compare their performance.
         
         Args:
             data (pd.DataFrame): Price data with datetime index and 'Close' column
             strategies (Dict[str, Strategy]): Dictionary of strategy names and strategy objects
+            max_workers (int): Worker processes to run strategies in (see iter_strategies())
+            use_threads (bool): Use worker threads instead of processes (default: False)
             
         Returns:
             Dict[str, Any]: Comparison results containing:
@@ -226,83 +545,101 @@ class Backtester:
         This method allows you to compare multiple strategies side-by-side
         and identify which one performs best for the given market conditions.
         """
-        results = {}
+        finished = {name: (signal_count, strategy_results)
+                    for name, signal_count, strategy_results
+                    in self.iter_strategies(data, strategies, max_workers, use_threads)}
         
-        for strategy_name, strategy in strategies.items():
-            logging.info(f"\nRunning {strategy_name} strategy...")
-            print(f"\nRunning {strategy_name} strategy...")
-            
-            # Debug: Check signal generation
-            signals = strategy.generate_signals(data)
-            signal_count = len(signals[signals != 0])
-            logging.info(f"Generated {signal_count} signals for {strategy_name}")
-            print(f"Generated {signal_count} signals for {strategy_name}")
-            
-            strategy_results = self.run(data, strategy)
+        # Report in the caller's order, not completion order
+        results = {}
+        for strategy_name in strategies:
+            signal_count, strategy_results = finished[strategy_name]
+            self.log_strategy_summary(strategy_name, signal_count, strategy_results)
             results[strategy_name] = strategy_results
-            
-            # Log and print summary for this strategy
-            logging.info(f"{strategy_name} - Total trades: {strategy_results['num_trades']}")
-            logging.info(f"{strategy_name} - Total return: {strategy_results['total_return']:.2%}")
-            logging.info(f"{strategy_name} - Sharpe ratio: {strategy_results['sharpe_ratio']:.2f}")
-            logging.info(f"{strategy_name} - Max drawdown: {strategy_results['max_drawdown']:.2%}")
-            
-            print(f"{strategy_name} - Total trades: {strategy_results['num_trades']}")
-            print(f"{strategy_name} - Total return: {strategy_results['total_return']:.2%}")
-            print(f"{strategy_name} - Sharpe ratio: {strategy_results['sharpe_ratio']:.2f}")
-            print(f"{strategy_name} - Max drawdown: {strategy_results['max_drawdown']:.2%}")
-        
-        # Create comparison table
-        comparison_data = []
-        for strategy_name, strategy_results in results.items():
-            comparison_data.append({
-                'Strategy': strategy_name,
-                'Total Return (%)': f"{strategy_results['total_return']:.2%}",
-                'Annualized Return (%)': f"{strategy_results['annualized_return']:.2%}",
-                'Sharpe Ratio': f"{strategy_results['sharpe_ratio']:.2f}",
-                'Max Drawdown (%)': f"{strategy_results['max_drawdown']:.2%}",
-                'Volatility (%)': f"{strategy_results['volatility']:.2%}",
-                'Number of Trades': strategy_results['num_trades'],
-                'Win Rate (%)': f"{strategy_results['win_rate']:.1%}",
-                'Profit Factor': f"{strategy_results['profit_factor']:.2f}"
-            })
-        
-        comparison_table = pd.DataFrame(comparison_data)
+        
+        comparison = self.compare_results(results)
+        comparison['results'] = results
+        return comparison
+    
+    @staticmethod
+    def log_strategy_summary(strategy_name: str, signal_count: int, strategy_results: Dict[str, Any]):
+        """Log and print the signal count and headline metrics of one strategy run"""
+        logging.info(f"\nRunning {strategy_name} strategy...")
+        print(f"\nRunning {strategy_name} strategy...")
+        
+        # Debug: Check signal generation
+        logging.info(f"Generated {signal_count} signals for {strategy_name}")
+        print(f"Generated {signal_count} signals for {strategy_name}")
+        
+        # Log and print summary for this strategy
+        logging.info(f"{strategy_name} - Total trades: {strategy_results['num_trades']}")
+        logging.info(f"{strategy_name} - Total return: {strategy_results['total_return']:.2%}")
+        logging.info(f"{strategy_name} - Sharpe ratio: {strategy_results['sharpe_ratio']:.2f}")
+        logging.info(f"{strategy_name} - Max drawdown: {strategy_results['max_drawdown']:.2%}")
+        
+        print(f"{strategy_name} - Total trades: {strategy_results['num_trades']}")
+        print(f"{strategy_name} - Total return: {strategy_results['total_return']:.2%}")
+        print(f"{strategy_name} - Sharpe ratio: {strategy_results['sharpe_ratio']:.2f}")
+        print(f"{strategy_name} - Max drawdown: {strategy_results['max_drawdown']:.2%}")
+    
+    @staticmethod
+    def compare_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build the comparison table and pick the best strategy.
+        
+        Args:
+            results (Dict[str, Dict[str, Any]]): Metrics per strategy name, as
+                returned by run(); the portfolio and trades are not needed
+                
+        Returns:
+            Dict[str, Any]: comparison_table and best_strategy
+        """
+        # Create comparison table, one list per column
+        comparison_table = pd.DataFrame({
+            'Strategy': list(results),
+            'Total Return (%)': [f"{r['total_return']:.2%}" for r in results.values()],
+            'Annualized Return (%)': [f"{r['annualized_return']:.2%}" for r in results.values()],
+            'Sharpe Ratio': [f"{r['sharpe_ratio']:.2f}" for r in results.values()],
+            'Max Drawdown (%)': [f"{r['max_drawdown']:.2%}" for r in results.values()],
+            'Volatility (%)': [f"{r['volatility']:.2%}" for r in results.values()],
+            'Number of Trades': [r['num_trades'] for r in results.values()],
+            'Win Rate (%)': [f"{r['win_rate']:.1%}" for r in results.values()],
+            'Profit Factor': [f"{r['profit_factor']:.2f}" for r in results.values()]
+        })
         
         # Find best strategy (by Sharpe ratio, then by total return)
-        best_strategy = max(results.keys(), 
-                           key=lambda x: (results[x]['sharpe_ratio'], results[x]['total_return']))
+        best_strategy = max(results.items(),
+                            key=lambda item: (item[1]['sharpe_ratio'], item[1]['total_return']))[0]
         
         return {
-            'results': results,
             'comparison_table': comparison_table,
             'best_strategy': best_strategy
         }
     
-    def _calculate_annualized_return(self, equity_curve: pd.Series) -> float:
+    def _calculate_annualized_return(self, equity_curve: np.ndarray, index: pd.DatetimeIndex) -> float:
         """
         Calculate annualized return from equity curve.
         
         Args:
-            equity_curve (pd.Series): Portfolio value over time
+            equity_curve (np.ndarray): Portfolio value over time
+            index (pd.DatetimeIndex): Timestamps of the equity curve
             
         Returns:
             float: Annualized return percentage
             
         Formula: (1 + total_return)^(365/days) - 1
         """
-        total_days = (equity_curve.index[-1] - equity_curve.index[0]).days
+        total_days = (index[-1] - index[0]).days
         if total_days == 0:
             return 0
-        total_return = (equity_curve.iloc[-1] - equity_curve.iloc[0]) / equity_curve.iloc[0]
+        total_return = (equity_curve[-1] - equity_curve[0]) / equity_curve[0]
         return (1 + total_return) ** (365 / total_days) - 1
     
-    def _calculate_sharpe_ratio(self, returns: pd.Series) -> float:
+    def _calculate_sharpe_ratio(self, returns: np.ndarray) -> float:
         """
         Calculate Sharpe ratio (risk-adjusted return).
         
         Args:
-            returns (pd.Series): Portfolio returns over time
+            returns (np.ndarray): Portfolio returns over time
             
         Returns:
             float: Sharpe ratio (higher is better)
@@ -311,67 +648,62 @@ class Backtester:
         - Assumes 0% risk-free rate
         - Annualized for minute-level data
         """
-        if returns.std() == 0:
+        std = returns.std(ddof=1)
+        if std == 0:
             return 0
-        return returns.mean() / returns.std() * np.sqrt(252 * 24 * 60)  # Annualized
+        return returns.mean() / std * ANNUALIZATION  # Annualized
     
-    def _calculate_max_drawdown(self, equity_curve: pd.Series) -> float:
+    def _calculate_max_drawdown(self, equity_curve) -> float:
         """
         Calculate maximum drawdown (largest peak-to-trough decline).
         
         Args:
-            equity_curve (pd.Series): Portfolio value over time
+            equity_curve (np.ndarray or pd.Series): Portfolio value over time
             
         Returns:
             float: Maximum drawdown as negative percentage
             
         Logic: Track running peak, calculate drawdown from peak
         """
-        peak = equity_curve.expanding().max()
+        equity_curve = np.asarray(equity_curve, dtype=np.float64)
+        peak = np.maximum.accumulate(equity_curve)
         drawdown = (equity_curve - peak) / peak
-        return drawdown.min()
+        return float(drawdown.min())
     
-    def _calculate_win_rate(self, portfolio: pd.DataFrame) -> float:
+    def _calculate_win_rate(self, trade_pnl: np.ndarray) -> float:
         """
         Calculate win rate (percentage of profitable trades).
         
         Args:
-            portfolio (pd.DataFrame): Portfolio data with 'signal' and 'daily_pnl' columns
+            trade_pnl (np.ndarray): Daily P&L on the bars where a trade was executed
             
         Returns:
             float: Win rate as percentage (0-100%)
             
         Logic: Count trades with positive P&L / total trades
         """
-        trades = portfolio[portfolio['signal'] != 0]
-        if len(trades) == 0:
+        if len(trade_pnl) == 0:
             return 0
         
-        winning_trades = 0
-        for i in range(len(trades)):
-            if trades['daily_pnl'].iloc[i] > 0:
-                winning_trades += 1
-        
-        return winning_trades / len(trades)
+        return float((trade_pnl > 0).mean())
     
-    def _calculate_profit_factor(self, portfolio: pd.DataFrame) -> float:
+    def _calculate_profit_factor(self, trade_pnl: np.ndarray) -> float:
         """
         Calculate profit factor (gross profit / gross loss).
         
         Args:
-            portfolio (pd.DataFrame): Portfolio data with 'signal' and 'daily_pnl' columns
+            trade_pnl (np.ndarray): Daily P&L on the bars where a trade was executed
             
         Returns:
             float: Profit factor (higher is better, >1 means profitable)
             
         Logic: Sum positive P&L / sum negative P&L
         """
-        trades = portfolio[portfolio['signal'] != 0]
-        if len(trades) == 0:
+        if len(trade_pnl) == 0:
             return 0
         
-        gross_profit = trades[trades['daily_pnl'] > 0]['daily_pnl'].sum()
-        gross_loss = abs(trades[trades['daily_pnl'] < 0]['daily_pnl'].sum())
+        gross_profit = trade_pnl[trade_pnl > 0].sum()
+        gross_loss = abs(trade_pnl[trade_pnl < 0].sum())
         
         if gross_loss == 0:
             return float('inf') if gross_profit > 0 else 0
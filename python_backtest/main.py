@@ -1,11 +1,19 @@
 import os
+
+# Strategies already run one per worker process, so keep BLAS/OpenMP pools at
+# one thread each instead of every worker starting a pool per core. This has
+# to happen before NumPy is first imported.
+for _var in ('OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'NUMEXPR_NUM_THREADS'):
+    os.environ.setdefault(_var, '1')
+
 import time
 import pandas as pd
-import matplotlib.pyplot as plt
-import sys
+import json
+import math
 import argparse
+from contextlib import contextmanager
 from datetime import datetime
-from utils.data_loader import load_data, print_data_summary, plot_price_volume
+from utils.data_loader import load_data_range, print_data_summary, plot_price_volume
 from strategies.moving_average import MovingAverageStrategy
 from strategies.moving_average_volume_compensated import MovingAverageVolumeCompensatedStrategy
 from strategies.mean_reversion import MeanReversionStrategy
@@ -32,35 +40,100 @@ MARKET_PERIODS = {
     'march_2020': ('2020-03-01', '2020-03-31', 'March 2020 (COVID Crash)'),
     'december_2017': ('2017-12-01', '2017-12-31', 'December 2017 (Bull Market)'),
 }
+PERIOD_CHOICES = list(MARKET_PERIODS) + ['custom']
+
+def _get_plt():
+    """Import pyplot on first use, so runs with --no-plots never load matplotlib"""
+    import matplotlib
+    matplotlib.use('Agg')  # plots are only saved to files, so skip GUI backend setup
+    # Merge line segments that deviate by less than a pixel; long 1-minute series render much faster
+    matplotlib.rcParams['path.simplify_threshold'] = 1.0
+    import matplotlib.pyplot as plt
+    return plt
+
+@contextmanager
+def timed(name: str):
+    """Log the wall-clock duration of the enclosed block, measured with perf_counter"""
+    start = time.perf_counter()
+    yield
+    logging.info(f"{name} took {time.perf_counter() - start:.3f}s")
+
+# Scalar metrics written to results.jsonl for post-processing
+METRIC_KEYS = ('total_return', 'annualized_return', 'sharpe_ratio', 'max_drawdown',
+               'volatility', 'num_trades', 'win_rate', 'profit_factor')
 
-def parse_arguments():
-    parser = argparse.ArgumentParser(description='Run trading strategy backtests')
-    parser.add_argument('--start_date', type=str, help='Start date (YYYY-MM-DD)')
-    parser.add_argument('--end_date', type=str, help='End date (YYYY-MM-DD)')
-    parser.add_argument('--period', type=str, choices=list(MARKET_PERIODS.keys()), 
-                       help='Predefined market period to test')
-    parser.add_argument('--stop_loss', type=float, default=0.02, 
-                       help='Stop-loss percentage (default: 0.02 = 2%%)')
-    parser.add_argument('--position_size', type=float, default=0.5, 
-                       help='Position size as percentage of capital (default: 0.5 = 50%%)')
+def save_metrics_jsonl(path: str, results_by_strategy: dict):
+    """
+    Write one JSON line of scalar metrics per strategy, e.g. for pd.read_json(path, lines=True).
     
-    args = parser.parse_args()
+    Non-finite values (an infinite profit factor with no losing trades, NaN
+    ratios on short or flat runs) are written as null, keeping the file
+    valid for strict JSON parsers.
+    """
+    with open(path, 'w') as f:
+        for name, results in results_by_strategy.items():
+            record = {'strategy': name}
+            for key in METRIC_KEYS:
+                value = results[key]
+                # NumPy scalars are not JSON serializable
+                if isinstance(value, np.generic):
+                    value = value.item()
+                if isinstance(value, float) and not math.isfinite(value):
+                    value = None
+                record[key] = value
+            f.write(json.dumps(record, allow_nan=False) + "\n")
+
+def save_equity_curves(path: str, equity_by_strategy: dict):
+    """Save each strategy's equity curve (total_value series) as a float32 column of one Parquet file"""
+    curves = pd.DataFrame({name: equity.astype(np.float32)
+                           for name, equity in equity_by_strategy.items()})
+    try:
+        curves.to_parquet(path, compression='zstd')
+    except ImportError:
+        logging.warning("Equity curves not saved: no Parquet engine found, install requirements.txt (pyarrow)")
+
+def _lttb_indices(y: np.ndarray, target: int) -> np.ndarray:
+    """
+    Pick `target` point positions with Largest-Triangle-Three-Buckets.
     
-    if args.period:
-        start_date, end_date, description = MARKET_PERIODS[args.period]
-        print(f"Using predefined period: {description}")
-        return start_date, end_date, args.stop_loss, args.position_size
-    elif args.start_date and args.end_date:
-        return args.start_date, args.end_date, args.stop_loss, args.position_size
-    else:
-        print("Available predefined periods:")
-        for key, (start, end, desc) in MARKET_PERIODS.items():
-            print(f"  {key}: {desc} ({start} to {end})")
-        print("\nUsage examples:")
-        print("  python main.py --period bull_2017")
-        print("  python main.py --start_date 2023-01-01 --end_date 2023-01-31")
-        print("  python main.py --period bear_2022 --stop_loss 0.03 --position_size 0.3")
-        sys.exit(1)
+    The first and last points are kept; from each bucket in between, the point
+    forming the largest triangle with the previously kept point and the mean
+    of the next bucket is kept, so peaks and drawdowns survive decimation.
+    """
+    n = len(y)
+    if target >= n or target < 3:
+        return np.arange(n)
+    
+    bucket_size = (n - 2) / (target - 2)
+    indices = np.empty(target, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    kept = 0
+    for i in range(target - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        next_x = (end + next_end - 1) / 2
+        next_y = y[end:next_end].mean()
+        
+        x = np.arange(start, end)
+        area = np.abs((kept - next_x) * (y[start:end] - y[kept]) - (kept - x) * (next_y - y[kept]))
+        kept = start + int(np.argmax(area))
+        indices[i + 1] = kept
+    return indices
+
+# Points per plotted series, a few per pixel column of the saved figures
+PLOT_POINTS = 4000
+
+def _downsample(series: pd.Series, target: int = PLOT_POINTS) -> pd.Series:
+    """Reduce a line plot's series to about `target` visually significant points"""
+    return series.iloc[_lttb_indices(series.to_numpy(dtype=np.float64), target)]
+
+def _label_counts(labels: pd.Series) -> dict:
+    """Count each distinct label, most frequent first (like value_counts(), as a plain dict)"""
+    values, counts = np.unique(labels.to_numpy(), return_counts=True)
+    order = np.argsort(-counts, kind='stable')
+    return dict(zip(values[order].tolist(), counts[order].tolist()))
 
 def setup_logging(output_dir: str):
     """
@@ -86,39 +159,15 @@ def setup_logging(output_dir: str):
         ]
     )
 
-def main():
+def build_parser() -> argparse.ArgumentParser:
     """
-    Main execution function for the backtesting framework.
+    Build the command line parser for main().
     
-    Command Line Arguments:
-        --period: Market period to test (bull/bear/crisis/recovery/recent/custom)
-        --start-date: Custom start date (YYYY-MM-DD format)
-        --end-date: Custom end date (YYYY-MM-DD format)
-        --short-window: Short MA period (default: 20)
-        --long-window: Long MA period (default: 50)
-        --min-crossover-strength: Signal strength threshold (default: 0.003)
-        --position-size: Capital fraction per trade (default: 0.8)
-        --stop-loss: Maximum loss percentage (default: 0.02)
-        --data-path: Path to CSV data file
-        --min-holding-period: Minimum holding period in minutes (0 = no restriction)
-        --enable-regime-detection: Enable market regime detection (ATR/ADX)
-        --disable-regime-detection: Disable market regime detection
-        --atr-period: Period for ATR calculation
-        --adx-period: Period for ADX calculation
-        --multi-strategy: Run multiple strategies and compare performance
-        --strategy: Strategy to use in single strategy mode (default: moving_average)
-        
-    Execution Flow:
-        1. Parse command line arguments
-        2. Setup logging and output directory
-        3. Load and filter price data
-        4. Create strategy and backtester
-        5. Run backtest simulation
-        6. Log results and generate plots
-        7. Save all outputs to timestamped directory
+    Kept separate from main() so sweep tooling can build it once and call
+    parse_args(argv) for each run.
     """
     parser = argparse.ArgumentParser(description='Run backtesting with different market periods')
-    parser.add_argument('--period', choices=list(MARKET_PERIODS.keys()) + ['custom'], 
+    parser.add_argument('--period', choices=PERIOD_CHOICES, 
                        default=os.getenv('DEFAULT_PERIOD', 'bull_2021'), help='Market period to test')
     parser.add_argument('--start-date', type=str, help='Custom start date (YYYY-MM-DD)')
     parser.add_argument('--end-date', type=str, help='Custom end date (YYYY-MM-DD)')
@@ -144,10 +193,53 @@ def main():
                        help='Period for ADX calculation')
     parser.add_argument('--multi-strategy', action='store_true',
                        help='Run multiple strategies and compare performance')
+    parser.add_argument('--no-plots', action='store_true',
+                       help='Skip generating plot images (metrics and result files are still written)')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Worker processes for --multi-strategy (default: one per strategy, capped at CPU count; 1 runs serially)')
     parser.add_argument('--strategy', choices=['moving_average', 'moving_average_volume_compensated', 'mean_reversion', 'mean_reversion_volume_compensated', 'rsi_bollinger'],
                        default='moving_average', help='Strategy to use in single strategy mode (default: moving_average)')
+    return parser
+
+def main(argv=None):
+    """
+    Main execution function for the backtesting framework.
     
-    args = parser.parse_args()
+    Args:
+        argv (list): Arguments to parse instead of sys.argv[1:] (optional)
+    
+    Command Line Arguments:
+        --period: Market period to test (bull/bear/crisis/recovery/recent/custom)
+        --start-date: Custom start date (YYYY-MM-DD format)
+        --end-date: Custom end date (YYYY-MM-DD format)
+        --short-window: Short MA period (default: 20)
+        --long-window: Long MA period (default: 50)
+        --min-crossover-strength: Signal strength threshold (default: 0.003)
+        --position-size: Capital fraction per trade (default: 0.8)
+        --stop-loss: Maximum loss percentage (default: 0.02)
+        --data-path: Path to CSV data file
+        --min-holding-period: Minimum holding period in minutes (0 = no restriction)
+        --enable-regime-detection: Enable market regime detection (ATR/ADX)
+        --disable-regime-detection: Disable market regime detection
+        --atr-period: Period for ATR calculation
+        --adx-period: Period for ADX calculation
+        --multi-strategy: Run multiple strategies and compare performance
+        --workers: Worker processes for --multi-strategy
+        --no-plots: Skip generating plot images
+        --strategy: Strategy to use in single strategy mode (default: moving_average)
+        
+    Execution Flow:
+        1. Parse command line arguments
+        2. Setup logging and output directory
+        3. Load and filter price data
+        4. Create strategy and backtester
+        5. Run backtest simulation
+        6. Log results and generate plots
+        7. Save all outputs to timestamped directory
+    """
+    args = build_parser().parse_args(argv)
+    if not args.no_plots:
+        plt = _get_plt()
 
     # Use RESULTS_DIR from .env, fallback to python_backtest/results
     results_base_dir = os.getenv('RESULTS_DIR', 'python_backtest/results')
@@ -157,10 +249,6 @@ def main():
     
     setup_logging(output_dir)
     
-    # Load data
-    logging.info("Loading data...")
-    data = load_data(args.data_path)
-    
     # Set date range - prioritize custom dates over predefined periods
     if args.start_date and args.end_date:
         start_date = args.start_date
@@ -182,8 +270,10 @@ def main():
         start_date, end_date, description = MARKET_PERIODS['bull_2021']
         logging.info(f"Using default period: bull_2021 market - {description}")
     
-    # Filter data by date range
-    data = data[(data.index >= start_date) & (data.index <= end_date)]
+    # Load only the selected date range instead of the full history
+    logging.info("Loading data...")
+    with timed("Loading data"):
+        data = load_data_range(args.data_path, start_date, end_date)
     logging.info(f"Data loaded: {len(data)} records from {data.index[0]} to {data.index[-1]}")
     
     # Create strategy
@@ -234,9 +324,68 @@ def main():
             stop_loss=args.stop_loss
         )
         
-        # Run multi-strategy backtest
+        # Run multi-strategy backtest, handling each strategy's results as soon
+        # as they arrive and keeping only its metrics and equity curve
         logging.info("Running multi-strategy backtest...")
-        comparison_results = backtester.run_multiple_strategies(data, strategies)
+        signal_counts = {}
+        metrics = {}
+        equity = {}
+        if not args.no_plots:
+            # Clear and reuse one figure for the per-strategy plots instead of
+            # setting up a new figure and renderer for every strategy
+            fig = plt.figure(figsize=(15, 10))
+        plot_seconds = 0.0
+        backtest_start = time.perf_counter()
+        for strategy_name, signal_count, strategy_results in backtester.iter_strategies(
+                data, strategies, max_workers=args.workers):
+            portfolio = strategy_results['portfolio']
+            signal_counts[strategy_name] = signal_count
+            metrics[strategy_name] = {key: strategy_results[key] for key in METRIC_KEYS}
+            equity[strategy_name] = portfolio['total_value'].astype(np.float32)
+            if args.no_plots:
+                continue
+            
+            # Plotting happens between results, so time it separately from the backtest
+            plot_start = time.perf_counter()
+            fig.clf()
+            ax1, ax2 = fig.subplots(2, 1, sharex=True)
+            # Price chart with buy/sell signals
+            price = _downsample(portfolio['price'])
+            ax1.plot(price.index, price.values, label='BTC Price', alpha=0.7)
+            times, prices, signal = portfolio.index, portfolio['price'].to_numpy(), portfolio['signal'].to_numpy()
+            buy_idx = np.flatnonzero(signal == 1)
+            sell_idx = np.flatnonzero(signal == -1)
+            if len(buy_idx) > 0:
+                ax1.scatter(times[buy_idx], prices[buy_idx], color='green', marker='^', s=60, label='Buy', alpha=0.8)
+            if len(sell_idx) > 0:
+                ax1.scatter(times[sell_idx], prices[sell_idx], color='red', marker='v', s=60, label='Sell', alpha=0.8)
+            ax1.set_title(f'{strategy_name} - Price & Signals')
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
+            # Equity curve (simple line like BTC price)
+            equity_curve = _downsample(portfolio['total_value'])
+            ax2.plot(equity_curve.index, equity_curve.values, label='Equity Curve', color='blue', linewidth=2)
+            
+            ax2.set_title('Equity Curve')
+            ax2.set_ylabel('Portfolio Value (USD)')
+            ax2.legend()
+            ax2.grid(True, alpha=0.3)
+            fig.tight_layout()
+            plot_filename = os.path.join(output_dir, f"{strategy_name.replace(' ', '_').replace('/', '_')}_plot.png")
+            fig.savefig(plot_filename, dpi=300, bbox_inches='tight')
+            logging.info(f"Saved plot for {strategy_name} to: {plot_filename}")
+            plot_seconds += time.perf_counter() - plot_start
+        logging.info(f"Multi-strategy backtest took {time.perf_counter() - backtest_start - plot_seconds:.3f}s")
+        if not args.no_plots:
+            plt.close(fig)
+            logging.info(f"Per-strategy plots took {plot_seconds:.3f}s")
+        
+        # Report and compare in the order the strategies were defined, not completion order
+        metrics = {name: metrics[name] for name in strategies}
+        equity = {name: equity[name] for name in strategies}
+        for strategy_name, strategy_metrics in metrics.items():
+            Backtester.log_strategy_summary(strategy_name, signal_counts[strategy_name], strategy_metrics)
+        comparison_results = Backtester.compare_results(metrics)
         
         # Log comparison results
         logging.info("Multi-strategy backtest completed!")
@@ -252,53 +401,28 @@ def main():
             f.write(f"Period: {start_date} to {end_date}\n")
             f.write(f"Best Strategy: {comparison_results['best_strategy']}\n\n")
             f.write(comparison_results['comparison_table'].to_string(index=False))
+        save_metrics_jsonl(os.path.join(output_dir, 'results.jsonl'), metrics)
+        save_equity_curves(os.path.join(output_dir, 'equity.parquet'), equity)
         
-        # Create and save per-strategy plots
-        for strategy_name, strategy_results in comparison_results['results'].items():
-            portfolio = strategy_results['portfolio']
-            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10), sharex=True)
-            # Price chart with buy/sell signals
-            ax1.plot(portfolio.index, portfolio['price'], label='BTC Price', alpha=0.7)
-            buy_signals = portfolio[portfolio['signal'] == 1]
-            sell_signals = portfolio[portfolio['signal'] == -1]
-            hold_signals = portfolio[portfolio['signal'] == 0]
-            if len(buy_signals) > 0:
-                ax1.scatter(buy_signals.index, buy_signals['price'], color='green', marker='^', s=60, label='Buy', alpha=0.8)
-            if len(sell_signals) > 0:
-                ax1.scatter(sell_signals.index, sell_signals['price'], color='red', marker='v', s=60, label='Sell', alpha=0.8)
-            ax1.set_title(f'{strategy_name} - Price & Signals')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
-            # Equity curve (simple line like BTC price)
-            ax2.plot(portfolio.index, portfolio['total_value'], label='Equity Curve', color='blue', linewidth=2)
-            
-            ax2.set_title('Equity Curve')
-            ax2.set_ylabel('Portfolio Value (USD)')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plot_filename = os.path.join(output_dir, f"{strategy_name.replace(' ', '_').replace('/', '_')}_plot.png")
-            plt.savefig(plot_filename, dpi=300, bbox_inches='tight')
-            plt.close(fig)
-            logging.info(f"Saved plot for {strategy_name} to: {plot_filename}")
-        
-        # Create comparison plot (do not show, only save)
-        plt.figure(figsize=(14, 8))
-        for strategy_name, strategy_results in comparison_results['results'].items():
-            portfolio = strategy_results['portfolio']
-            plt.plot(portfolio.index, portfolio['total_value'], 
-                    label=f'{strategy_name} (Return: {strategy_results["total_return"]:.1%})', linewidth=2)
-        plt.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Initial Capital')
-        plt.title(f'Strategy Comparison - {args.period.upper()} Market')
-        plt.ylabel('Portfolio Value (USD)')
-        plt.xlabel('Date')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        comparison_plot_file = os.path.join(output_dir, 'strategy_comparison.png')
-        plt.savefig(comparison_plot_file, dpi=300, bbox_inches='tight')
-        plt.close()
+        if not args.no_plots:
+            # Create comparison plot (do not show, only save)
+            plt.figure(figsize=(14, 8))
+            for strategy_name, equity_curve in equity.items():
+                equity_curve = _downsample(equity_curve)
+                plt.plot(equity_curve.index, equity_curve.values, 
+                        label=f'{strategy_name} (Return: {metrics[strategy_name]["total_return"]:.1%})', linewidth=2)
+            plt.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Initial Capital')
+            plt.title(f'Strategy Comparison - {args.period.upper()} Market')
+            plt.ylabel('Portfolio Value (USD)')
+            plt.xlabel('Date')
+            plt.legend()
+            plt.grid(True, alpha=0.3)
+            comparison_plot_file = os.path.join(output_dir, 'strategy_comparison.png')
+            plt.savefig(comparison_plot_file, dpi=150, bbox_inches='tight')
+            plt.close()
         logging.info(f"Comparison results saved to: {comparison_file}")
-        logging.info(f"Comparison plot saved to: {comparison_plot_file}")
+        if not args.no_plots:
+            logging.info(f"Comparison plot saved to: {comparison_plot_file}")
         
     else:
         # Single strategy mode
@@ -358,7 +482,8 @@ def main():
         
         # Run backtest
         logging.info("Running backtest...")
-        results = backtester.run(data, strategy)
+        with timed("Backtest"):
+            results = backtester.run(data, strategy)
         
         # Log results
         logging.info("Backtest completed!")
@@ -373,154 +498,175 @@ def main():
         
         # Save results to file
         results_file = os.path.join(output_dir, 'results.txt')
+        lines = [
+            f"Backtest Results - {args.period.upper()} Market",
+            "=" * 50,
+            f"Period: {start_date} to {end_date}",
+            f"Strategy: {strategy_name}",
+            f"Min Crossover Strength: {args.min_crossover_strength}",
+            f"Position Size: {args.position_size:.1%}",
+            f"Stop Loss: {args.stop_loss:.1%}",
+            f"Initial Capital: $100.00",
+            f"Final Capital: ${results['portfolio']['total_value'].to_numpy()[-1]:.2f}",
+            f"Total Return: {results['total_return']:.2%}",
+            f"Annualized Return: {results['annualized_return']:.2%}",
+            f"Sharpe Ratio: {results['sharpe_ratio']:.2f}",
+            f"Max Drawdown: {results['max_drawdown']:.2%}",
+            f"Volatility: {results['volatility']:.2%}",
+            f"Number of Trades: {results['num_trades']}",
+            f"Win Rate: {results['win_rate']:.2%}",
+            f"Profit Factor: {results['profit_factor']:.2f}",
+        ]
         with open(results_file, 'w') as f:
-            f.write(f"Backtest Results - {args.period.upper()} Market\n")
-            f.write("=" * 50 + "\n")
-            f.write(f"Period: {start_date} to {end_date}\n")
-            f.write(f"Strategy: {strategy_name}\n")
-            f.write(f"Min Crossover Strength: {args.min_crossover_strength}\n")
-            f.write(f"Position Size: {args.position_size:.1%}\n")
-            f.write(f"Stop Loss: {args.stop_loss:.1%}\n")
-            f.write(f"Initial Capital: $100.00\n")
-            f.write(f"Final Capital: ${results['portfolio']['total_value'].iloc[-1]:.2f}\n")
-            f.write(f"Total Return: {results['total_return']:.2%}\n")
-            f.write(f"Annualized Return: {results['annualized_return']:.2%}\n")
-            f.write(f"Sharpe Ratio: {results['sharpe_ratio']:.2f}\n")
-            f.write(f"Max Drawdown: {results['max_drawdown']:.2%}\n")
-            f.write(f"Volatility: {results['volatility']:.2%}\n")
-            f.write(f"Number of Trades: {results['num_trades']}\n")
-            f.write(f"Win Rate: {results['win_rate']:.2%}\n")
-            f.write(f"Profit Factor: {results['profit_factor']:.2f}\n")
+            f.write("\n".join(lines) + "\n")
+        save_metrics_jsonl(os.path.join(output_dir, 'results.jsonl'), {strategy_name: results})
+        save_equity_curves(os.path.join(output_dir, 'equity.parquet'),
+                           {strategy_name: results['portfolio']['total_value']})
         
         # Create plots
         portfolio = results['portfolio']
         
-        # Plot 1: Price and signals
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10), sharex=True)
+        if not args.no_plots:
+            # Plot 1: Price and signals
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(15, 10), sharex=True)
         
-        # Price chart with buy/sell signals
-        ax1.plot(portfolio.index, portfolio['price'], label='BTC Price', alpha=0.7)
+            # Price chart with buy/sell signals
+            price = _downsample(portfolio['price'])
+            ax1.plot(price.index, price.values, label='BTC Price', alpha=0.7)
         
-        # Plot buy signals
-        buy_signals = portfolio[portfolio['signal'] == 1]
-        if len(buy_signals) > 0:
-            ax1.scatter(buy_signals.index, buy_signals['price'], 
-                       color='green', marker='^', s=100, label='Buy Signal', alpha=0.8)
+            # Positions of buy and sell signals, used to index the raw arrays
+            times, prices, signal = portfolio.index, portfolio['price'].to_numpy(), portfolio['signal'].to_numpy()
+            buy_idx = np.flatnonzero(signal == 1)
+            sell_idx = np.flatnonzero(signal == -1)
+            
+            # Plot buy signals
+            if len(buy_idx) > 0:
+                ax1.scatter(times[buy_idx], prices[buy_idx], 
+                           color='green', marker='^', s=100, label='Buy Signal', alpha=0.8)
         
-        # Plot sell signals
-        sell_signals = portfolio[portfolio['signal'] == -1]
-        if len(sell_signals) > 0:
-            ax1.scatter(sell_signals.index, sell_signals['price'], 
-                       color='red', marker='v', s=100, label='Sell Signal', alpha=0.8)
+            # Plot sell signals
+            if len(sell_idx) > 0:
+                ax1.scatter(times[sell_idx], prices[sell_idx], 
+                           color='red', marker='v', s=100, label='Sell Signal', alpha=0.8)
         
-        ax1.set_title(f'BTC Price and Trading Signals - {args.period.upper()} Market')
-        ax1.set_ylabel('Price (USD)')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
+            ax1.set_title(f'BTC Price and Trading Signals - {args.period.upper()} Market')
+            ax1.set_ylabel('Price (USD)')
+            ax1.legend()
+            ax1.grid(True, alpha=0.3)
         
-        # Portfolio value line (simple progression like BTC price)
-        ax2.plot(portfolio.index, portfolio['total_value'], label='Portfolio Value', color='blue', linewidth=2)
-        ax2.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Initial Capital')
+            # Portfolio value line (simple progression like BTC price)
+            equity_curve = _downsample(portfolio['total_value'])
+            ax2.plot(equity_curve.index, equity_curve.values, label='Portfolio Value', color='blue', linewidth=2)
+            ax2.axhline(y=100, color='red', linestyle='--', alpha=0.7, label='Initial Capital')
         
-        ax2.set_title('Portfolio Value Over Time')
-        ax2.set_ylabel('Portfolio Value (USD)')
-        ax2.set_xlabel('Date')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
+            ax2.set_title('Portfolio Value Over Time')
+            ax2.set_ylabel('Portfolio Value (USD)')
+            ax2.set_xlabel('Date')
+            ax2.legend()
+            ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
-        plot_file = os.path.join(output_dir, 'backtest_results.png')
-        plt.savefig(plot_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        logging.info(f"Saved plot for backtest results to: {plot_file}")
+            plt.tight_layout()
+            plot_file = os.path.join(output_dir, 'backtest_results.png')
+            plt.savefig(plot_file, dpi=300, bbox_inches='tight')
+            plt.close()
+            logging.info(f"Saved plot for backtest results to: {plot_file}")
         
         # Plot 2: Market Regime Analysis (if enabled)
         if enable_regime and 'ATR' in data.columns and 'ADX' in data.columns:
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+            if not args.no_plots:
+                fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
             
-            # ATR (Volatility)
-            ax1.plot(data.index, data['ATR'], label='ATR', color='purple', alpha=0.7)
-            ax1.set_title('Average True Range (Volatility)')
-            ax1.set_ylabel('ATR')
-            ax1.legend()
-            ax1.grid(True, alpha=0.3)
+                # ATR (Volatility)
+                atr = _downsample(data['ATR'])
+                ax1.plot(atr.index, atr.values, label='ATR', color='purple', alpha=0.7)
+                ax1.set_title('Average True Range (Volatility)')
+                ax1.set_ylabel('ATR')
+                ax1.legend()
+                ax1.grid(True, alpha=0.3)
             
-            # ADX (Trend Strength)
-            ax2.plot(data.index, data['ADX'], label='ADX', color='orange', alpha=0.7)
-            ax2.axhline(y=25, color='red', linestyle='--', alpha=0.7, label='Strong Trend (25)')
-            ax2.axhline(y=20, color='yellow', linestyle='--', alpha=0.7, label='Weak Trend (20)')
-            ax2.set_title('Average Directional Index (Trend Strength)')
-            ax2.set_ylabel('ADX')
-            ax2.legend()
-            ax2.grid(True, alpha=0.3)
+                # ADX (Trend Strength)
+                adx = _downsample(data['ADX'])
+                ax2.plot(adx.index, adx.values, label='ADX', color='orange', alpha=0.7)
+                ax2.axhline(y=25, color='red', linestyle='--', alpha=0.7, label='Strong Trend (25)')
+                ax2.axhline(y=20, color='yellow', linestyle='--', alpha=0.7, label='Weak Trend (20)')
+                ax2.set_title('Average Directional Index (Trend Strength)')
+                ax2.set_ylabel('ADX')
+                ax2.legend()
+                ax2.grid(True, alpha=0.3)
             
-            # Volatility Regime
-            regime_colors = {'high': 'red', 'medium': 'yellow', 'low': 'green'}
-            for regime in ['high', 'medium', 'low']:
-                regime_data = data[data['volatility_regime'] == regime]
-                if len(regime_data) > 0:
-                    ax3.scatter(regime_data.index, regime_data['Close'], 
-                               c=regime_colors[regime], label=f'{regime.capitalize()} Volatility', 
-                               alpha=0.6, s=10)
-            ax3.set_title('Price by Volatility Regime')
-            ax3.set_ylabel('Price (USD)')
-            ax3.legend()
-            ax3.grid(True, alpha=0.3)
+                # Regime scatters keep every step-th bar, thinning each regime
+                # evenly to about as many points as the line plots
+                step = max(1, len(data) // PLOT_POINTS)
+                
+                # Volatility Regime
+                regime_colors = {'high': 'red', 'medium': 'yellow', 'low': 'green'}
+                for regime in ['high', 'medium', 'low']:
+                    regime_close = data['Close'][data['volatility_regime'] == regime].iloc[::step]
+                    if len(regime_close) > 0:
+                        ax3.scatter(regime_close.index, regime_close.values, 
+                                   c=regime_colors[regime], label=f'{regime.capitalize()} Volatility', 
+                                   alpha=0.6, s=10)
+                ax3.set_title('Price by Volatility Regime')
+                ax3.set_ylabel('Price (USD)')
+                ax3.legend()
+                ax3.grid(True, alpha=0.3)
             
-            # Trend Regime
-            trend_colors = {'trending': 'blue', 'moderate': 'orange', 'ranging': 'gray'}
-            for regime in ['trending', 'moderate', 'ranging']:
-                regime_data = data[data['trend_regime'] == regime]
-                if len(regime_data) > 0:
-                    ax4.scatter(regime_data.index, regime_data['Close'], 
-                               c=trend_colors[regime], label=f'{regime.capitalize()} Trend', 
-                               alpha=0.6, s=10)
-            ax4.set_title('Price by Trend Regime')
-            ax4.set_ylabel('Price (USD)')
-            ax4.legend()
-            ax4.grid(True, alpha=0.3)
+                # Trend Regime
+                trend_colors = {'trending': 'blue', 'moderate': 'orange', 'ranging': 'gray'}
+                for regime in ['trending', 'moderate', 'ranging']:
+                    regime_close = data['Close'][data['trend_regime'] == regime].iloc[::step]
+                    if len(regime_close) > 0:
+                        ax4.scatter(regime_close.index, regime_close.values, 
+                                   c=trend_colors[regime], label=f'{regime.capitalize()} Trend', 
+                                   alpha=0.6, s=10)
+                ax4.set_title('Price by Trend Regime')
+                ax4.set_ylabel('Price (USD)')
+                ax4.legend()
+                ax4.grid(True, alpha=0.3)
             
-            plt.tight_layout()
-            regime_file = os.path.join(output_dir, 'market_regime_analysis.png')
-            plt.savefig(regime_file, dpi=300, bbox_inches='tight')
-            plt.close()
-            logging.info(f"Saved plot for market regime analysis to: {regime_file}")
+                plt.tight_layout()
+                regime_file = os.path.join(output_dir, 'market_regime_analysis.png')
+                plt.savefig(regime_file, dpi=300, bbox_inches='tight')
+                plt.close()
+                logging.info(f"Saved plot for market regime analysis to: {regime_file}")
             
             # Log regime statistics
             if 'volatility_regime' in data.columns and 'trend_regime' in data.columns:
-                vol_stats = data['volatility_regime'].value_counts()
-                trend_stats = data['trend_regime'].value_counts()
+                vol_stats = _label_counts(data['volatility_regime'])
+                trend_stats = _label_counts(data['trend_regime'])
                 
                 logging.info("Market Regime Analysis:")
-                logging.info(f"Volatility Regimes: {dict(vol_stats)}")
-                logging.info(f"Trend Regimes: {dict(trend_stats)}")
+                logging.info(f"Volatility Regimes: {vol_stats}")
+                logging.info(f"Trend Regimes: {trend_stats}")
                 
                 # Save regime statistics to results file
                 with open(results_file, 'a') as f:
-                    f.write(f"\nMarket Regime Analysis:\n")
-                    f.write(f"Volatility Regimes: {dict(vol_stats)}\n")
-                    f.write(f"Trend Regimes: {dict(trend_stats)}\n")
+                    f.write(f"\nMarket Regime Analysis:\n"
+                            f"Volatility Regimes: {vol_stats}\n"
+                            f"Trend Regimes: {trend_stats}\n")
         
-        # Plot 3: Daily P&L distribution
-        plt.figure(figsize=(12, 6))
-        daily_pnl = portfolio['daily_pnl'].dropna()
-        plt.hist(daily_pnl, bins=50, alpha=0.7, color='skyblue', edgecolor='black')
-        plt.axvline(x=0, color='red', linestyle='--', alpha=0.7)
-        plt.title('Daily P&L Distribution')
-        plt.xlabel('Daily P&L (USD)')
-        plt.ylabel('Frequency')
-        plt.grid(True, alpha=0.3)
+        if not args.no_plots:
+            # Plot 3: Daily P&L distribution
+            plt.figure(figsize=(12, 6))
+            daily_pnl = portfolio['daily_pnl'].dropna()
+            plt.hist(daily_pnl, bins=50, alpha=0.7, color='skyblue', edgecolor='black')
+            plt.axvline(x=0, color='red', linestyle='--', alpha=0.7)
+            plt.title('Daily P&L Distribution')
+            plt.xlabel('Daily P&L (USD)')
+            plt.ylabel('Frequency')
+            plt.grid(True, alpha=0.3)
         
-        pnl_file = os.path.join(output_dir, 'daily_pnl_distribution.png')
-        plt.savefig(pnl_file, dpi=300, bbox_inches='tight')
-        plt.close()
-        logging.info(f"Saved plot for daily P&L distribution to: {pnl_file}")
+            pnl_file = os.path.join(output_dir, 'daily_pnl_distribution.png')
+            plt.savefig(pnl_file, dpi=300, bbox_inches='tight')
+            plt.close()
+            logging.info(f"Saved plot for daily P&L distribution to: {pnl_file}")
         
         logging.info(f"Results saved to: {output_dir}")
-        if enable_regime and 'ATR' in data.columns:
-            logging.info(f"Plots saved as: {plot_file}, {regime_file}, {pnl_file}")
-        else:
-            logging.info(f"Plots saved as: {plot_file}, {pnl_file}")
+        if not args.no_plots:
+            if enable_regime and 'ATR' in data.columns:
+                logging.info(f"Plots saved as: {plot_file}, {regime_file}, {pnl_file}")
+            else:
+                logging.info(f"Plots saved as: {plot_file}, {pnl_file}")
 
 if __name__ == "__main__":
     main()
@@ -1,5 +1,6 @@
 import pandas as pd
-from strategies.base import Strategy
+import numpy as np
+from strategies.base import Strategy, _min_holding_period_filter
 
 class MeanReversionStrategy(Strategy):
     """
@@ -56,14 +57,13 @@ class MeanReversionStrategy(Strategy):
         """
         # Calculate market regime indicators
         if self.enable_regime_detection:
-            atr = self._calculate_atr(data, self.atr_period)
-            adx = self._calculate_adx(data, self.adx_period)
+            atr, adx, volatility_regime = self._regime_indicators(data)
             
             # Store regime information for potential use in backtester
             data = data.copy()
             data['ATR'] = atr
             data['ADX'] = adx
-            data['volatility_regime'] = self._classify_volatility_regime(atr)
+            data['volatility_regime'] = volatility_regime
             data['trend_regime'] = self._classify_trend_regime(adx)
         
         # Get adaptive parameters based on current market regime
@@ -146,23 +146,5 @@ class MeanReversionStrategy(Strategy):
     
     def _apply_min_holding_period(self, signal: pd.Series, min_periods: int) -> pd.Series:
         """Apply minimum holding period to prevent rapid trading"""
-        filtered_signal = signal.copy()
-        position = 0
-        position_start = 0
-        
-        for i in range(len(signal)):
-            if signal.iloc[i] != 0:  # New signal
-                if position == 0:  # No position, can enter
-                    position = signal.iloc[i]
-                    position_start = i
-                elif position != signal.iloc[i]:  # Opposite signal
-                    if i - position_start >= min_periods:  # Minimum holding period met
-                        position = signal.iloc[i]
-                        position_start = i
-                    else:  # Ignore signal, maintain current position
-                        filtered_signal.iloc[i] = 0
-                # If same signal, ignore (already in position)
-                else:
-                    filtered_signal.iloc[i] = 0
-        
-        return filtered_signal 
\ No newline at end of file
+        filtered = _min_holding_period_filter(signal.to_numpy(dtype=np.int64), min_periods)
+        return pd.Series(filtered, index=signal.index, name=signal.name) 
\ No newline at end of file
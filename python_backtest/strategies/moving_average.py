@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from strategies.base import Strategy
+from strategies.base import Strategy, _min_holding_period_filter
 
 class MovingAverageStrategy(Strategy):
     """
@@ -78,14 +78,13 @@ class MovingAverageStrategy(Strategy):
         """
         # Calculate market regime indicators
         if self.enable_regime_detection:
-            atr = self._calculate_atr(data, self.atr_period)
-            adx = self._calculate_adx(data, self.adx_period)
+            atr, adx, volatility_regime = self._regime_indicators(data)
             
             # Store regime information for potential use in backtester
             data = data.copy()
             data['ATR'] = atr
             data['ADX'] = adx
-            data['volatility_regime'] = self._classify_volatility_regime(atr)
+            data['volatility_regime'] = volatility_regime
             data['trend_regime'] = self._classify_trend_regime(adx)
         
         # Get adaptive parameters based on current market regime
@@ -177,109 +176,6 @@ class MovingAverageStrategy(Strategy):
         
         return base_params
     
-    def _calculate_atr(self, data: pd.DataFrame, period: int) -> pd.Series:
-        """
-        Calculate Average True Range (ATR) for volatility measurement.
-        
-        Args:
-            data (pd.DataFrame): Price data with 'High', 'Low', 'Close' columns
-            period (int): Period for ATR calculation
-            
-        Returns:
-            pd.Series: ATR values
-            
-        ATR measures volatility by considering:
-        - High-Low range
-        - High-Previous Close range
-        - Low-Previous Close range
-        """
-        high = data['High']
-        low = data['Low']
-        close = data['Close']
-        
-        # Calculate True Range
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        # Calculate ATR as rolling average of True Range
-        atr = true_range.rolling(window=period, min_periods=1).mean()
-        
-        return atr
-    
-    def _calculate_adx(self, data: pd.DataFrame, period: int) -> pd.Series:
-        """
-        Calculate Average Directional Index (ADX) for trend strength measurement.
-        
-        Args:
-            data (pd.DataFrame): Price data with 'High', 'Low', 'Close' columns
-            period (int): Period for ADX calculation
-            
-        Returns:
-            pd.Series: ADX values
-            
-        ADX measures trend strength:
-        - ADX > 25: Strong trend
-        - ADX < 20: Weak trend or ranging market
-        - ADX 20-25: Moderate trend
-        """
-        high = data['High']
-        low = data['Low']
-        close = data['Close']
-        
-        # Calculate +DM and -DM
-        high_diff = high - high.shift(1)
-        low_diff = low.shift(1) - low
-        
-        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0)
-        minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0)
-        
-        # Calculate True Range (same as ATR)
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        # Calculate smoothed values
-        tr_smooth = true_range.rolling(window=period, min_periods=1).mean()
-        plus_dm_smooth = pd.Series(plus_dm, index=data.index).rolling(window=period, min_periods=1).mean()
-        minus_dm_smooth = pd.Series(minus_dm, index=data.index).rolling(window=period, min_periods=1).mean()
-        
-        # Calculate +DI and -DI
-        plus_di = 100 * (plus_dm_smooth / tr_smooth)
-        minus_di = 100 * (minus_dm_smooth / tr_smooth)
-        
-        # Calculate DX and ADX
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period, min_periods=1).mean()
-        
-        return adx
-    
-    def _classify_volatility_regime(self, atr: pd.Series) -> pd.Series:
-        """
-        Classify volatility regime based on ATR values.
-        
-        Args:
-            atr (pd.Series): ATR values
-            
-        Returns:
-            pd.Series: Volatility regime classification
-                - 'high': High volatility (ATR > 75th percentile)
-                - 'medium': Medium volatility (ATR between 25th and 75th percentile)
-                - 'low': Low volatility (ATR < 25th percentile)
-        """
-        # Use rolling percentiles to adapt to changing market conditions
-        high_threshold = atr.rolling(window=100, min_periods=1).quantile(0.75)
-        low_threshold = atr.rolling(window=100, min_periods=1).quantile(0.25)
-        
-        regime = pd.Series('medium', index=atr.index)
-        regime[atr > high_threshold] = 'high'
-        regime[atr < low_threshold] = 'low'
-        
-        return regime
-    
     def _classify_trend_regime(self, adx: pd.Series) -> pd.Series:
         """
         Classify trend regime based on ADX values.
@@ -319,22 +215,5 @@ class MovingAverageStrategy(Strategy):
             - This prevents whipsaw trading and reduces transaction costs
             - Note: This method is only called if min_holding_period > 0
         """
-        filtered_signal = signal.copy()
-        position = 0  # 0: no position, 1: long, -1: short
-        position_start = 0
-        
-        for i in range(len(signal)):
-            if signal.iloc[i] != 0:  # New signal detected
-                if position == 0:  # No current position, can enter
-                    position = signal.iloc[i]
-                    position_start = i
-                elif position != signal.iloc[i]:  # Opposite signal (potential reversal)
-                    if i - position_start >= min_periods:  # Minimum holding period met
-                        position = signal.iloc[i]
-                        position_start = i
-                    else:  # Ignore signal, maintain current position
-                        filtered_signal.iloc[i] = 0
-                else:  # Same signal, ignore (already in position)
-                    filtered_signal.iloc[i] = 0
-        
-        return filtered_signal
+        filtered = _min_holding_period_filter(signal.to_numpy(dtype=np.int64), min_periods)
+        return pd.Series(filtered, index=signal.index, name=signal.name)
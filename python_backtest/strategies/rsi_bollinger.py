@@ -1,5 +1,4 @@
 import pandas as pd
-import numpy as np
 from strategies.base import Strategy
 
 class RSIBollingerStrategy(Strategy):
@@ -55,14 +54,13 @@ class RSIBollingerStrategy(Strategy):
         """
         # Calculate market regime indicators
         if self.enable_regime_detection:
-            atr = self._calculate_atr(data, self.atr_period)
-            adx = self._calculate_adx(data, self.adx_period)
+            atr, adx, volatility_regime = self._regime_indicators(data)
             
             # Store regime information for potential use in backtester
             data = data.copy()
             data['ATR'] = atr
             data['ADX'] = adx
-            data['volatility_regime'] = self._classify_volatility_regime(atr)
+            data['volatility_regime'] = volatility_regime
             data['trend_regime'] = self._classify_trend_regime(adx)
         
         # Get adaptive parameters based on current market regime
@@ -219,61 +217,6 @@ class RSIBollingerStrategy(Strategy):
         
         return base_params
     
-    def _calculate_atr(self, data: pd.DataFrame, period: int) -> pd.Series:
-        """Calculate Average True Range (ATR) for volatility measurement."""
-        high = data['High']
-        low = data['Low']
-        close = data['Close']
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        atr = true_range.rolling(window=period, min_periods=1).mean()
-        
-        return atr
-    
-    def _calculate_adx(self, data: pd.DataFrame, period: int) -> pd.Series:
-        """Calculate Average Directional Index (ADX) for trend strength measurement."""
-        high = data['High']
-        low = data['Low']
-        close = data['Close']
-        
-        high_diff = high - high.shift(1)
-        low_diff = low.shift(1) - low
-        
-        plus_dm = np.where((high_diff > low_diff) & (high_diff > 0), high_diff, 0)
-        minus_dm = np.where((low_diff > high_diff) & (low_diff > 0), low_diff, 0)
-        
-        tr1 = high - low
-        tr2 = abs(high - close.shift(1))
-        tr3 = abs(low - close.shift(1))
-        true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-        
-        tr_smooth = true_range.rolling(window=period, min_periods=1).mean()
-        plus_dm_smooth = pd.Series(plus_dm, index=data.index).rolling(window=period, min_periods=1).mean()
-        minus_dm_smooth = pd.Series(minus_dm, index=data.index).rolling(window=period, min_periods=1).mean()
-        
-        plus_di = 100 * (plus_dm_smooth / tr_smooth)
-        minus_di = 100 * (minus_dm_smooth / tr_smooth)
-        
-        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
-        adx = dx.rolling(window=period, min_periods=1).mean()
-        
-        return adx
-    
-    def _classify_volatility_regime(self, atr: pd.Series) -> pd.Series:
-        """Classify volatility regime based on ATR values."""
-        high_threshold = atr.rolling(window=100, min_periods=1).quantile(0.75)
-        low_threshold = atr.rolling(window=100, min_periods=1).quantile(0.25)
-        
-        regime = pd.Series('medium', index=atr.index)
-        regime[atr > high_threshold] = 'high'
-        regime[atr < low_threshold] = 'low'
-        
-        return regime
-    
     def _classify_trend_regime(self, adx: pd.Series) -> pd.Series:
         """Classify trend regime based on ADX values."""
         regime = pd.Series('ranging', index=adx.index)
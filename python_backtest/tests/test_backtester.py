@@ -0,0 +1,103 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtester import Backtester, _new_day_mask, _simulate, _simulate_impl
+from strategies.mean_reversion import MeanReversionStrategy
+from strategies.moving_average import MovingAverageStrategy
+from strategies.rsi_bollinger import RSIBollingerStrategy
+
+
+def _bars(close, start='2024-01-01 23:57'):
+    """Minute bars with the given closes, starting three minutes before midnight"""
+    index = pd.date_range(start, periods=len(close), freq='min')
+    return pd.DataFrame({'Close': np.asarray(close, dtype=np.float64)}, index=index)
+
+
+def test_cash_and_position_carry_forward_across_day_boundary():
+    # Long from bar 0, held over midnight (bar 3), closed on bar 4 and
+    # re-entered on bar 5 with the carried cash
+    data = _bars([100.0, 100.0, 110.0, 110.0, 120.0, 120.0])
+    signals = np.array([1, 0, 0, 0, -1, 1], dtype=np.int8)
+    backtester = Backtester(initial_capital=100.0, position_size=0.5, stop_loss=0.5)
+
+    portfolio = backtester.run(data, None, signals=signals)['portfolio']
+
+    # Bar 0: buy 0.5 shares for 50. Bar 3: new day, the previous day's
+    # profit of 5 is reinvested into cash. Bar 4: sell 0.5 shares at 120.
+    # Bar 5: buy with half of the carried 115.
+    np.testing.assert_allclose(portfolio['cash'], [50.0, 50.0, 50.0, 55.0, 115.0, 57.5])
+    np.testing.assert_allclose(portfolio['position'], [0.5, 0.5, 0.5, 0.5, 0.0, 57.5 / 120.0])
+    np.testing.assert_allclose(portfolio['total_value'], [100.0, 100.0, 105.0, 110.0, 115.0, 115.0])
+
+
+def _random_walk(n=3000, seed=0):
+    """OHLCV minute bars over a few days, volatile enough to trigger stop-losses"""
+    rng = np.random.default_rng(seed)
+    close = 100.0 + np.cumsum(rng.normal(0.0, 0.3, n))
+    index = pd.date_range('2024-01-01', periods=n, freq='min')
+    return pd.DataFrame({
+        'Open': close,
+        'High': close + 0.2,
+        'Low': close - 0.2,
+        'Close': close,
+        'Volume': rng.random(n),
+    }, index=index)
+
+
+def _random_signals(runs, n, seed=1):
+    rng = np.random.default_rng(seed)
+    return rng.choice(np.array([-1, 0, 1], dtype=np.int8), size=(runs, n), p=[0.02, 0.96, 0.02])
+
+
+def test_run_batch_matches_run():
+    data = _random_walk()
+    signal_matrix = _random_signals(4, len(data))
+    backtester = Backtester()
+
+    batch = backtester.run_batch(data, signal_matrix, names=['a', 'b', 'c', 'd'])
+
+    for name, signals in zip(batch.columns, signal_matrix):
+        expected = backtester.run(data, None, signals=signals)['portfolio']['total_value']
+        np.testing.assert_array_equal(batch[name].to_numpy(), expected.to_numpy())
+
+
+def test_compiled_kernel_matches_python_fallback():
+    data = _random_walk()
+    close = data['Close'].to_numpy()
+    new_day = _new_day_mask(data.index)
+    signals = _random_signals(1, len(data))[0]
+
+    compiled = _simulate(close, signals.copy(), new_day, 100.0, 0.8, 0.02, True)
+    python = _simulate_impl(close, signals.copy(), new_day, 100.0, 0.8, 0.02, True)
+
+    for compiled_arr, python_arr in zip(compiled, python):
+        np.testing.assert_array_equal(compiled_arr, python_arr)
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'max_workers': 3},
+    {'max_workers': 3, 'use_threads': True},
+])
+def test_iter_strategies_parallel_matches_serial(kwargs):
+    data = _random_walk()
+
+    def strategies():
+        return {
+            'ma': MovingAverageStrategy(short_window=5, long_window=20),
+            'mr': MeanReversionStrategy(),
+            'rsi': RSIBollingerStrategy(),
+        }
+
+    serial = {name: (count, results) for name, count, results
+              in Backtester().iter_strategies(data, strategies(), max_workers=1)}
+    parallel = {name: (count, results) for name, count, results
+                in Backtester().iter_strategies(data, strategies(), **kwargs)}
+
+    assert parallel.keys() == serial.keys()
+    for name, (count, results) in serial.items():
+        parallel_count, parallel_results = parallel[name]
+        assert parallel_count == count
+        pd.testing.assert_frame_equal(parallel_results['portfolio'], results['portfolio'])
+        for key in ('total_return', 'sharpe_ratio', 'max_drawdown', 'num_trades', 'win_rate', 'profit_factor'):
+            assert parallel_results[key] == results[key] or (np.isnan(parallel_results[key]) and np.isnan(results[key]))
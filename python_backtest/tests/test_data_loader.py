@@ -0,0 +1,48 @@
+import pandas as pd
+import pytest
+
+from utils.data_loader import load_data, load_data_range
+
+START = pd.Timestamp('2024-01-01')
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    """Minute bars for 500 minutes, ending in blank lines like hand-edited exports"""
+    timestamps = START.timestamp() + 60 * pd.RangeIndex(500)
+    df = pd.DataFrame({
+        'Timestamp': timestamps.astype(int),
+        'Open': 100.0,
+        'High': 101.0,
+        'Low': 99.0,
+        'Close': 100.5,
+        'Volume': 1.0,
+    })
+    path = tmp_path / 'bars.csv'
+    path.write_text(df.to_csv(index=False) + '\n\n')
+    return str(path)
+
+
+@pytest.mark.parametrize('start_minute, end_minute', [
+    (0, 499),       # whole file
+    (10, 20),       # inside
+    (490, 600),     # runs past the last row and into the blank lines
+    (-60, 5),       # starts before the first row
+    (600, 700),     # after the last row
+    (250, 250),     # single row
+])
+def test_load_data_range_matches_filtered_load_data(csv_path, start_minute, end_minute):
+    start = START + pd.Timedelta(minutes=start_minute)
+    end = START + pd.Timedelta(minutes=end_minute)
+
+    data = load_data(csv_path, use_cache=False)
+    expected = data[(data.index >= start) & (data.index <= end)]
+
+    result = load_data_range(csv_path, start, end, use_cache=False)
+
+    if expected.empty:
+        # A header-only CSV parses with object dtypes, so only compare the shape
+        assert result.empty
+        assert list(result.columns) == list(expected.columns)
+    else:
+        pd.testing.assert_frame_equal(result, expected)
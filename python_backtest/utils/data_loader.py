@@ -1,13 +1,148 @@
+import importlib.util
+import io
+import os
+
 import pandas as pd
-import matplotlib.pyplot as plt
 
-def load_data(filepath: str) -> pd.DataFrame:
-    df = pd.read_csv(filepath)
+def _cache_path(filepath: str) -> str:
+    return os.path.splitext(filepath)[0] + '.parquet'
+
+
+def _cache_is_fresh(cache: str, filepath: str) -> bool:
+    return os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filepath)
+
+
+def _parquet_available() -> bool:
+    return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+
+def _index_by_timestamp(df: pd.DataFrame) -> pd.DataFrame:
     df['Timestamp'] = pd.to_datetime(df['Timestamp'], unit='s')
     df.set_index('Timestamp', inplace=True)
     return df
 
 
+def _write_cache(df: pd.DataFrame, cache: str):
+    """Write the cache through a temporary file so an interrupted write never leaves a truncated one"""
+    tmp = f"{cache}.{os.getpid()}.tmp"
+    try:
+        df.to_parquet(tmp, compression='zstd')
+        os.replace(tmp, cache)
+    except (ImportError, OSError):
+        # No Parquet engine installed or the data directory is read-only
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def load_data(filepath: str, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load OHLCV data from a CSV with a Unix-seconds Timestamp column.
+
+    The parsed frame is cached in a sibling .parquet file (needs pyarrow or
+    fastparquet), which is read instead of the CSV while it is newer than it.
+    A cache that cannot be read is rebuilt from the CSV.
+    """
+    cache = _cache_path(filepath)
+    if use_cache and _cache_is_fresh(cache, filepath):
+        try:
+            return pd.read_parquet(cache)
+        except (ImportError, OSError, ValueError):
+            # No engine, or a corrupt cache (Arrow errors are ValueErrors)
+            pass
+
+    df = _index_by_timestamp(pd.read_csv(filepath))
+
+    if use_cache:
+        _write_cache(df, cache)
+    return df
+
+
+def _next_timestamp(f, pos: int, hi: int):
+    """
+    (start, length, timestamp) of the first line in [pos, hi) with a numeric
+    Timestamp, or None. Blank or malformed lines, e.g. trailing empty lines,
+    are skipped like pd.read_csv skips them.
+    """
+    f.seek(pos)
+    while pos < hi:
+        line = f.readline()
+        if not line:
+            break
+        try:
+            return pos, len(line), float(line.split(b',', 1)[0])
+        except ValueError:
+            pos += len(line)
+    return None
+
+
+def _csv_offset(f, lo: int, hi: int, before) -> int:
+    """
+    Byte offset of the first line in [lo, hi) whose Timestamp is not
+    `before` the bound, or hi. lo must be the start of a line and the
+    file's timestamps must be ascending.
+    """
+    while lo < hi:
+        mid = (lo + hi) // 2
+        # Start of the first line at or after mid
+        f.seek(mid - 1)
+        f.readline()
+        pos = f.tell()
+        if pos >= hi:
+            # No line starts in [mid, hi), so step through the few lines from lo
+            pos = lo
+        found = _next_timestamp(f, pos, hi)
+        if found is None:
+            # Only blank lines from pos on
+            hi = pos
+            continue
+        start, length, timestamp = found
+        if before(timestamp):
+            lo = start + length
+        else:
+            hi = start
+    return lo
+
+
+def _read_csv_range(filepath: str, start: pd.Timestamp, end: pd.Timestamp) -> pd.DataFrame:
+    """Parse only the CSV rows between start and end, found by binary search on the file"""
+    start_s = start.timestamp()
+    end_s = end.timestamp()
+    with open(filepath, 'rb') as f:
+        header = f.readline()
+        size = os.fstat(f.fileno()).st_size
+        first = _csv_offset(f, len(header), size, lambda ts: ts < start_s)
+        last = _csv_offset(f, first, size, lambda ts: ts <= end_s)
+        f.seek(first)
+        rows = f.read(last - first)
+    return _index_by_timestamp(pd.read_csv(io.BytesIO(header + rows)))
+
+
+def load_data_range(filepath: str, start_date, end_date, use_cache: bool = True) -> pd.DataFrame:
+    """
+    Load the rows of a time-ordered OHLCV CSV with start_date <= Timestamp <= end_date.
+
+    Only the requested rows are read: a fresh Parquet cache is read with the
+    date range pushed down as a filter, and otherwise the range's byte
+    offsets in the CSV are binary-searched and just those lines are parsed.
+    When a Parquet engine is available but the cache is missing or stale, the
+    whole CSV is parsed once through load_data() to (re)build the cache.
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    cache = _cache_path(filepath)
+    if use_cache and _parquet_available():
+        if _cache_is_fresh(cache, filepath):
+            try:
+                return pd.read_parquet(cache, filters=[('Timestamp', '>=', start), ('Timestamp', '<=', end)])
+            except (OSError, ValueError):
+                # Corrupt cache; load_data() rebuilds it from the CSV
+                pass
+        data = load_data(filepath, use_cache=True)
+        first = data.index.searchsorted(start, side='left')
+        last = data.index.searchsorted(end, side='right')
+        return data.iloc[first:last]
+    return _read_csv_range(filepath, start, end)
+
 def print_data_summary(df: pd.DataFrame):
     print('--- Data Summary ---')
     print(df.describe())
@@ -20,6 +155,8 @@ def print_data_summary(df: pd.DataFrame):
 
 
 def plot_price_volume(df: pd.DataFrame, n: int = 1000, last: bool = False):
+    # Imported here so loading data for a backtest does not pay for matplotlib
+    import matplotlib.pyplot as plt
     if last:
         df = df.tail(n)
     else:
@@ -0,0 +1,34 @@
+"""
+Optional Numba support for the simulation kernels.
+
+When Numba is installed, `njit` and `prange` are the real Numba objects and
+the decorated kernels are compiled to native code. Without Numba, `njit` is a
+no-op decorator and `prange` falls back to `range`, so the same kernels still
+run as plain Python (just slower).
+
+Compiled kernels are cached on disk (cache=True) in NUMBA_CACHE_DIR, which
+defaults to ~/.cache/tradingbot_numba so the cache also works when the source
+tree is read-only and is shared by every worker process.
+"""
+
+import os
+
+# Numba reads its configuration on import, so this must be set first
+os.environ.setdefault('NUMBA_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'tradingbot_numba'))
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit, usable with or without arguments."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func):
+            return func
+
+        return decorator
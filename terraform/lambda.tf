@@ -59,6 +59,7 @@ resource "aws_iam_policy" "dynamodb_access" {
       Effect   = "Allow"
       Action   = [
         "dynamodb:PutItem",
+        "dynamodb:BatchWriteItem",
         "dynamodb:GetItem",
         "dynamodb:Query",
         "dynamodb:Scan"
@@ -99,6 +100,17 @@ resource "aws_lambda_function" "trading_bot" {
   timeout     = 60
   memory_size = 256
   
+  # Publish a version on every deploy; the "live" alias below points at it
+  # and SnapStart (when enabled) only applies to published versions
+  publish = true
+  
+  dynamic "snap_start" {
+    for_each = var.lambda_snap_start ? [1] : []
+    content {
+      apply_on = "PublishedVersions"
+    }
+  }
+  
   environment {
     variables = {
       DYNAMO_TABLE             = aws_dynamodb_table.trades.name
@@ -108,6 +120,15 @@ resource "aws_lambda_function" "trading_bot" {
   }
 }
 
+# Alias that always points at the latest published version; the scheduler
+# invokes the alias so it picks up the snapshotted version
+resource "aws_lambda_alias" "trading_bot_live" {
+  name             = "live"
+  description      = "Latest published version of the trading bot"
+  function_name    = aws_lambda_function.trading_bot.function_name
+  function_version = aws_lambda_function.trading_bot.version
+}
+
 # CloudWatch Log Group for Lambda with 14-day retention
 resource "aws_cloudwatch_log_group" "lambda_logs" {
   name              = "/aws/lambda/${aws_lambda_function.trading_bot.function_name}"
@@ -125,7 +146,7 @@ resource "aws_cloudwatch_event_rule" "hourly_execution" {
 resource "aws_cloudwatch_event_target" "trigger_lambda" {
   rule      = aws_cloudwatch_event_rule.hourly_execution.name
   target_id = "TriggerTradingBot"
-  arn       = aws_lambda_function.trading_bot.arn
+  arn       = aws_lambda_alias.trading_bot_live.arn
 }
 
 # Permission allowing EventBridge to invoke the Lambda
@@ -133,6 +154,7 @@ resource "aws_lambda_permission" "allow_eventbridge" {
   statement_id  = "AllowExecutionFromEventBridge"
   action        = "lambda:InvokeFunction"
   function_name = aws_lambda_function.trading_bot.function_name
+  qualifier     = aws_lambda_alias.trading_bot_live.name
   principal     = "events.amazonaws.com"
   source_arn    = aws_cloudwatch_event_rule.hourly_execution.arn
 }
@@ -22,4 +22,9 @@ output "lambda_arn" {
 output "log_group_name" {
   value       = aws_cloudwatch_log_group.lambda_logs.name
   description = "CloudWatch Log Group for the Lambda function"
-}
\ No newline at end of file
+}
+
+output "lambda_alias_arn" {
+  value       = aws_lambda_alias.trading_bot_live.arn
+  description = "The ARN of the live alias invoked by the hourly schedule"
+}
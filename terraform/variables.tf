@@ -1,5 +1,19 @@
+# Binance's production API is hosted in AWS ap-northeast-1 (Tokyo). Deploying
+# the bot and the kline collector there avoids a cross-region round trip on
+# every exchange request; the default stays eu-central-1 to keep the existing
+# DynamoDB table and secrets in place.
 variable "aws_region" {
-  description = "The AWS region to deploy to"
+  description = "The AWS region to deploy to (use ap-northeast-1 to colocate with the Binance API)"
   type        = string
   default     = "eu-central-1"
 }
+
+# SnapStart snapshots the initialised bot (imports, boto3 clients) so cold
+# starts restore from it instead of re-importing boto3 and requests. Lambda only
+# supports SnapStart for Python 3.12+, so enable it together with moving the
+# runtime and the dependency layer off python3.11.
+variable "lambda_snap_start" {
+  description = "Enable Lambda SnapStart on published versions of the trading bot (requires a python3.12+ runtime)"
+  type        = bool
+  default     = false
+}